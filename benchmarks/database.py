@@ -0,0 +1,95 @@
+import argparse
+import os
+import random
+import tempfile
+import time
+from pycheckers.database import PositionDatabase, game_entries
+from pycheckers.game import initial_setup_board, legal_moves
+from pycheckers.read_and_play import RESULTS, game_move_to_pdn
+
+
+def random_playout(rng: random.Random, max_plies: int) -> tuple[list[str], list[int]]:
+    game = initial_setup_board()
+    moves = []
+    hashes = [game.hash]
+    while len(moves) < max_plies and not game.is_over():
+        options = [
+            (pos, path) for pos, paths in legal_moves(game).items() for path in paths
+        ]
+        if not options:
+            break
+        pos, path = rng.choice(options)
+        moves.append(game_move_to_pdn(game, pos, path))
+        game.move(pos, path)
+        hashes.append(game.hash)
+    return moves, hashes
+
+
+def synthetic_archive(pool: list, count: int, rng: random.Random):
+    # Games are drawn from a pool of distinct playouts, so the archive has
+    # the heavy sharing of opening positions that real archives have
+    for i in range(count):
+        _, hashes = pool[rng.randrange(len(pool))]
+        yield f"synthetic-{i}", rng.choice(RESULTS[:3]), hashes
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Position database benchmark")
+    parser.add_argument("--games", type=int, default=1_000_000)
+    parser.add_argument("--pool", type=int, default=2000)
+    parser.add_argument("--max-plies", type=int, default=100)
+    parser.add_argument("--batch-size", type=int, default=1000)
+    parser.add_argument("--queries", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    start = time.perf_counter()
+    pool = [random_playout(rng, args.max_plies) for _ in range(args.pool)]
+    print(f"Generated {len(pool)} playouts in {time.perf_counter() - start:.1f}s")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        # Full ingest path: PDN parsing, replay and insertion
+        pdn_path = os.path.join(tmp, "pool.pdn")
+        with open(pdn_path, "w") as f:
+            for moves, _ in pool:
+                f.write(" ".join(moves) + " 1/2-1/2\n\n")
+        db = PositionDatabase(os.path.join(tmp, "replay.sqlite"))
+        start = time.perf_counter()
+        count = db.add_games(game_entries([pdn_path]), args.batch_size)
+        elapsed = time.perf_counter() - start
+        print(f"PDN replay ingest: {count / elapsed:,.0f} games/s")
+        db.close()
+
+        # Bulk insertion of a large synthetic archive
+        db = PositionDatabase(os.path.join(tmp, "synthetic.sqlite"))
+        start = time.perf_counter()
+        count = db.add_games(
+            synthetic_archive(pool, args.games, rng), args.batch_size
+        )
+        elapsed = time.perf_counter() - start
+        (rows,) = db.connection.execute("SELECT COUNT(*) FROM positions").fetchone()
+        print(
+            f"Bulk ingest: {count:,} games, {rows:,} positions in {elapsed:.1f}s "
+            f"({count / elapsed:,.0f} games/s, {rows / elapsed:,.0f} positions/s)"
+        )
+
+        # Query latency, for positions from the start and the end of games
+        hashes = [
+            hashes[rng.randrange(len(hashes))]
+            for _, hashes in (pool[rng.randrange(len(pool))] for _ in range(args.queries))
+        ]
+        for name, query in (
+            ("outcome_stats", db.outcome_stats),
+            ("games_with_position", db.games_with_position),
+        ):
+            start = time.perf_counter()
+            for h in hashes:
+                query(h)
+            elapsed = time.perf_counter() - start
+            print(f"{name}: {elapsed / len(hashes) * 1000:.2f} ms/query")
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+import argparse
+import random
+import tracemalloc
+from pycheckers.game import initial_setup_board, legal_moves, random_move
+from pycheckers.position import PackedPosition
+
+
+def sample_games(count: int, seed: int) -> list:
+    random.seed(seed)
+    games = []
+    game = initial_setup_board()
+    while len(games) < count:
+        if game.is_over() or not legal_moves(game):
+            game = initial_setup_board()
+        random_move(game)
+        games.append(game.copy())
+    return games
+
+
+def measure(build) -> int:
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    stored = build()
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    size = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+    del stored
+    return size
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Memory per stored position")
+    parser.add_argument("--positions", type=int, default=10_000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    games = sample_games(args.positions, args.seed)
+    n = len(games)
+
+    results = {
+        "CheckersGame.copy()": measure(lambda: [g.copy() for g in games]),
+        "board dict": measure(lambda: [g.board.copy() for g in games]),
+        "PackedPosition": measure(
+            lambda: [PackedPosition.from_game(g) for g in games]
+        ),
+    }
+    for name, size in results.items():
+        print(f"{name:>20}: {size / n:8.1f} bytes/position")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+MODULES = [
+    "pycheckers",
+    "pycheckers.game",
+    "pycheckers.read_and_play",
+    "pycheckers.cli",
+    "pycheckers.minimax",
+    "pycheckers.svg",
+]
+
+
+def import_time(module: str, env: dict) -> int:
+    # Cumulative import time of the module in microseconds, as reported
+    # by python -X importtime
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    for line in result.stderr.splitlines():
+        fields = [field.strip() for field in line.split("|")]
+        if len(fields) == 3 and fields[2] == module:
+            return int(fields[1])
+    raise RuntimeError(f"No import time reported for {module}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Import time of the package")
+    parser.add_argument("--runs", type=int, default=20)
+    args = parser.parse_args()
+
+    env = dict(os.environ)
+    # Measure with bytecode caching, as an installed package would run
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    env["PYTHONPATH"] = os.getcwd()
+
+    for module in MODULES:
+        import_time(module, env)  # warm up the bytecode cache
+        times = [import_time(module, env) for _ in range(args.runs)]
+        print(f"{module:>25}: {statistics.median(times) / 1000:6.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -1 +1,45 @@
-from .main import *
+import importlib
+
+# Names are resolved lazily, so that importing a single submodule (as the
+# command line entry points do) does not import the whole package
+_LAZY_MODULES = ("pycheckers.game", "pycheckers.svg")
+
+# Listed explicitly, since `from pycheckers import *` can't discover lazy
+# names by itself
+__all__ = [
+    "BadMoveException",
+    "CheckerColor",
+    "CheckerLevel",
+    "CheckerPiece",
+    "CheckersException",
+    "CheckersGame",
+    "RED_START_POS",
+    "WHITE_START_POS",
+    "ascii_symbol",
+    "capture_square",
+    "get_capture_sq",
+    "initial_setup_board",
+    "is_capture_move",
+    "is_empty",
+    "is_king",
+    "is_man",
+    "is_red",
+    "is_white",
+    "legal_moves",
+    "nearby_squares",
+    "out_of_bounds",
+    "random_move",
+    "render",
+]
+
+
+def __getattr__(name):
+    for module_name in _LAZY_MODULES:
+        module = importlib.import_module(module_name)
+        if hasattr(module, name):
+            return getattr(module, name)
+    raise AttributeError(f"module 'pycheckers' has no attribute '{name}'")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,4 @@
+import sys
+from pycheckers.cli import main
+
+sys.exit(main())
@@ -0,0 +1,237 @@
+import argparse
+import sys
+from collections.abc import Iterable, Iterator
+from pycheckers.game import CheckersException, CheckersGame, initial_setup_board
+from pycheckers.piece import CheckerColor
+from pycheckers.variants import ENGLISH, VARIANTS
+from pycheckers.read_and_play import (
+    game_move_to_pdn,
+    move_from_pdn,
+    open_pdn,
+    parse_pdn_game,
+    parse_pdn_moves,
+    replay,
+    split_pdn_games,
+)
+
+# The search, rendering and match modules are imported by the subcommands
+# that use them, so that batch runs of the other subcommands don't pay for
+# them at startup.
+
+
+class _Report:
+    # Prints problems with the input as they are found and counts them, so
+    # that one bad file or game doesn't stop the rest of the batch
+    def __init__(self, file):
+        self.file = file
+        self.count = 0
+
+    def __call__(self, message: str) -> None:
+        print(message, file=self.file)
+        self.count += 1
+
+    def exit_status(self) -> int:
+        return 1 if self.count else 0
+
+
+def _read_games(
+    filenames: list[str], report: _Report
+) -> Iterator[tuple[str, list, str | None]]:
+    # Yields (label, moves, result) for every game in every file, "-" reads
+    # from standard input
+    for filename in filenames:
+        # Undecodable input is replaced when reading files, but standard
+        # input can still fail to decode
+        try:
+            if filename == "-":
+                yield from _parse_games("<stdin>", sys.stdin, report)
+                continue
+            with open_pdn(filename) as f:
+                yield from _parse_games(filename, f, report)
+        except (OSError, ValueError) as e:
+            report(f"{filename}: {e}")
+
+
+def _parse_games(
+    name: str, lines: Iterable[str], report: _Report
+) -> Iterator[tuple[str, list, str | None]]:
+    for i, (move_text, tag_result) in enumerate(split_pdn_games(lines), 1):
+        label = f"{name}#{i}"
+        try:
+            moves, result = parse_pdn_game(move_text, tag_result)
+        except ValueError as e:
+            report(f"{label}: invalid game: {e}")
+            continue
+        yield label, moves, result
+
+
+def _final_positions(
+    filenames: list[str], variant_name: str, report: _Report
+) -> Iterator[tuple[str, CheckersGame]]:
+    variant = VARIANTS[variant_name]
+    for label, moves, _ in _read_games(filenames, report):
+        try:
+            for game in replay(moves, variant):
+                pass
+        except (CheckersException, ValueError) as e:
+            report(f"{label}: invalid game: {e}")
+            continue
+        yield label, game
+
+
+def play(args: argparse.Namespace) -> int:
+    from pycheckers.match import EngineConfig, play_game
+
+    variant = VARIANTS[args.variant]
+    try:
+        opening = [
+            move_from_pdn(move, variant) for move in parse_pdn_moves(args.moves)[0]
+        ]
+        game = initial_setup_board(variant)
+        for pos, path in opening:
+            game.move(pos, path)
+    except (CheckersException, ValueError) as e:
+        print(f"invalid opening: {e}", file=sys.stderr)
+        return 1
+    engine = EngineConfig(f"depth {args.depth}", args.depth)
+    record = play_game(
+        engine, engine, opening, CheckerColor.RED, args.max_plies, variant
+    )
+
+    game = initial_setup_board(variant)
+    pdn_moves = []
+    for pos, path in opening + record.moves:
+        pdn_moves.append(game_move_to_pdn(game, pos, path))
+        game.make_move(pos, path)
+    print(" ".join(pdn_moves))
+    if record.winner is None:
+        print("1/2-1/2")
+    elif record.winner == CheckerColor.RED:
+        print("1-0")
+    else:
+        print("0-1")
+    return 0
+
+
+def replay_games(args: argparse.Namespace) -> int:
+    variant = VARIANTS[args.variant]
+    report = _Report(sys.stdout)
+    for label, moves, result in _read_games(args.files, report):
+        try:
+            for game in replay(moves, variant):
+                if args.boards:
+                    print(f"{game}\n")
+        except (CheckersException, ValueError) as e:
+            report(f"{label}: invalid game: {e}")
+            continue
+        if not args.quiet:
+            print(f"{label}: ok, {len(moves)} plies, result {result}")
+    return report.exit_status()
+
+
+def render(args: argparse.Namespace) -> int:
+    import os
+    from pycheckers.svg import render as render_svg
+
+    # Output files are named after the input file, or after its whole path
+    # when two inputs share a file name
+    basenames = [os.path.basename(f) for f in args.files]
+    output_names = {
+        f: b if basenames.count(b) == 1 else os.path.normpath(f).lstrip(os.sep)
+        for f, b in zip(args.files, basenames)
+    }
+    output_names["<stdin>"] = "stdin"
+
+    report = _Report(sys.stderr)
+    for label, game in _final_positions(args.files, args.variant, report):
+        svg = render_svg(game, args.size)
+        if args.output_dir is None:
+            print(svg)
+            continue
+        filename, _, number = label.rpartition("#")
+        name = output_names[filename].replace(os.sep, "_") + f"-{number}.svg"
+        try:
+            with open(os.path.join(args.output_dir, name), "w") as f:
+                f.write(svg)
+        except OSError as e:
+            report(f"{label}: {e}")
+    return report.exit_status()
+
+
+def analyse(args: argparse.Namespace) -> int:
+    from pycheckers.minimax import analyse as analyse_position
+
+    report = _Report(sys.stderr)
+    for label, game in _final_positions(args.files, args.variant, report):
+        if game.is_over():
+            print(f"{label}: game over")
+            continue
+        for line in analyse_position(game, args.depth, args.multipv):
+            print(
+                f"{label}: {' '.join(line.pv)} score {line.score} "
+                f"({line.nodes} nodes)"
+            )
+    return report.exit_status()
+
+
+def _positive_int(text: str) -> int:
+    value = int(text)
+    if value < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1: {text}")
+    return value
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="pycheckers",
+        description="Checkers tools. Arguments can be read from a file with @file.",
+        fromfile_prefix_chars="@",
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    play_parser = subparsers.add_parser("play", help="play an engine self-play game")
+    play_parser.add_argument("--depth", type=int, default=4)
+    play_parser.add_argument("--max-plies", type=int, default=200)
+    play_parser.add_argument(
+        "--moves", default="", help='opening moves, e.g. "22-18 11-15"'
+    )
+    play_parser.set_defaults(handler=play)
+
+    replay_parser = subparsers.add_parser(
+        "replay", help="check that the games in PDN files are legal"
+    )
+    replay_parser.add_argument("files", nargs="+")
+    replay_parser.add_argument("--boards", action="store_true")
+    replay_parser.add_argument("--quiet", action="store_true")
+    replay_parser.set_defaults(handler=replay_games)
+
+    render_parser = subparsers.add_parser(
+        "render", help="render the final positions of PDN games as SVG"
+    )
+    render_parser.add_argument("files", nargs="+")
+    render_parser.add_argument("--size", type=int, default=400)
+    render_parser.add_argument("--output-dir")
+    render_parser.set_defaults(handler=render)
+
+    analyse_parser = subparsers.add_parser(
+        "analyse", help="search the final positions of PDN games"
+    )
+    analyse_parser.add_argument("files", nargs="+")
+    analyse_parser.add_argument("--depth", type=int, default=6)
+    analyse_parser.add_argument(
+        "--multipv",
+        type=_positive_int,
+        default=1,
+        help="number of best lines to show",
+    )
+    analyse_parser.set_defaults(handler=analyse)
+
+    for subparser in subparsers.choices.values():
+        subparser.add_argument("--variant", choices=VARIANTS, default=ENGLISH.name)
+
+    args = parser.parse_args(argv)
+    return args.handler(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
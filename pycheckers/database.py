@@ -0,0 +1,191 @@
+import argparse
+import sqlite3
+import sys
+import time
+from collections.abc import Iterable, Iterator
+from pycheckers.game import CheckersException, CheckersGame
+from pycheckers.read_and_play import (
+    open_pdn,
+    parse_pdn_game,
+    parse_pdn_moves,
+    replay,
+    split_pdn_games,
+)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS games (
+    id INTEGER PRIMARY KEY,
+    source TEXT,
+    result TEXT
+);
+CREATE TABLE IF NOT EXISTS positions (
+    hash INTEGER NOT NULL,
+    game_id INTEGER NOT NULL,
+    ply INTEGER NOT NULL
+);
+"""
+
+INDEX = "CREATE INDEX IF NOT EXISTS positions_hash ON positions (hash, game_id)"
+
+# A game to be stored: where it came from, its PDN result and the hash
+# of every position it reached, indexed by ply
+GameEntry = tuple[str | None, str | None, list[int]]
+
+
+class PositionDatabase:
+    def __init__(self, path: str = ":memory:"):
+        self.connection = sqlite3.connect(path)
+        self.connection.executescript(SCHEMA)
+        # The database is an index that can be rebuilt from the archives,
+        # so durability is traded for ingest speed
+        self.connection.execute("PRAGMA journal_mode = WAL")
+        self.connection.execute("PRAGMA synchronous = OFF")
+
+    def close(self) -> None:
+        self.connection.close()
+
+    def add_games(
+        self,
+        games: Iterable[GameEntry],
+        batch_size: int = 1000,
+        rebuild_index: bool | None = None,
+    ) -> int:
+        # Inserts games in batches of one transaction each. For bulk loads
+        # the hash index is dropped while loading and rebuilt afterwards,
+        # which is much faster than updating it row by row, but rebuilding
+        # it over a large table costs far more than adding a few games with
+        # the index in place. By default only a load into an empty
+        # database is treated as bulk. The index is rebuilt even if loading
+        # fails part way, keeping the batches already committed.
+        (next_id,) = self.connection.execute(
+            "SELECT COALESCE(MAX(id), 0) + 1 FROM games"
+        ).fetchone()
+        if rebuild_index is None:
+            rebuild_index = next_id == 1
+        if rebuild_index:
+            self.connection.execute("DROP INDEX IF EXISTS positions_hash")
+        try:
+            count = 0
+            game_rows = []
+            position_rows = []
+            for source, result, hashes in games:
+                game_rows.append((next_id, source, result))
+                position_rows.extend(
+                    (h, next_id, ply) for ply, h in enumerate(hashes)
+                )
+                next_id += 1
+                count += 1
+                if len(game_rows) >= batch_size:
+                    self._insert(game_rows, position_rows)
+                    game_rows = []
+                    position_rows = []
+            if game_rows:
+                self._insert(game_rows, position_rows)
+        finally:
+            if rebuild_index:
+                self.create_index()
+        return count
+
+    def _insert(self, game_rows: list, position_rows: list) -> None:
+        with self.connection:
+            self.connection.executemany(
+                "INSERT INTO games (id, source, result) VALUES (?, ?, ?)", game_rows
+            )
+            self.connection.executemany(
+                "INSERT INTO positions (hash, game_id, ply) VALUES (?, ?, ?)",
+                position_rows,
+            )
+
+    def create_index(self) -> None:
+        with self.connection:
+            self.connection.execute(INDEX)
+
+    def games_with_position(self, position_hash: int) -> list[tuple[int, int, str]]:
+        return self.connection.execute(
+            "SELECT p.game_id, p.ply, g.result FROM positions p "
+            "JOIN games g ON g.id = p.game_id "
+            "WHERE p.hash = ? ORDER BY p.game_id, p.ply",
+            (position_hash,),
+        ).fetchall()
+
+    def outcome_stats(self, position_hash: int) -> dict[str | None, int]:
+        # Number of games reaching the position, by result. A game that
+        # reaches the position more than once is counted once.
+        rows = self.connection.execute(
+            "SELECT g.result, COUNT(*) FROM games g WHERE g.id IN "
+            "(SELECT game_id FROM positions WHERE hash = ?) "
+            "GROUP BY g.result",
+            (position_hash,),
+        ).fetchall()
+        return dict(rows)
+
+    def outcome_stats_after_move(
+        self,
+        game: CheckersGame,
+        start: tuple[int, int],
+        path: list[tuple[int, int]],
+    ) -> dict[str | None, int]:
+        undo = game.make_move(start, path)
+        position_hash = game.hash
+        game.unmake_move(undo)
+        return self.outcome_stats(position_hash)
+
+
+def game_entries(filenames: Iterable[str]) -> Iterator[GameEntry]:
+    # Games that can't be parsed or replayed, and files that can't be
+    # read, are reported on stderr and skipped
+    for filename in filenames:
+        try:
+            with open_pdn(filename) as f:
+                for i, (move_text, tag_result) in enumerate(split_pdn_games(f), 1):
+                    try:
+                        moves, result = parse_pdn_game(move_text, tag_result)
+                        hashes = [game.hash for game in replay(moves)]
+                    except (CheckersException, ValueError) as e:
+                        print(f"{filename}#{i}: invalid game: {e}", file=sys.stderr)
+                        continue
+                    yield filename, result, hashes
+        except OSError as e:
+            print(f"{filename}: {e}", file=sys.stderr)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Index positions of PDN archives")
+    parser.add_argument("database")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    ingest_parser = subparsers.add_parser("ingest")
+    ingest_parser.add_argument("files", nargs="+")
+    ingest_parser.add_argument("--batch-size", type=int, default=1000)
+    ingest_parser.add_argument(
+        "--rebuild-index",
+        action="store_true",
+        default=None,
+        help="drop and rebuild the index even if the database is not empty",
+    )
+
+    query_parser = subparsers.add_parser("query")
+    query_parser.add_argument(
+        "moves", help='moves from the initial position, e.g. "22-18 11-15"'
+    )
+
+    args = parser.parse_args()
+    db = PositionDatabase(args.database)
+    if args.command == "ingest":
+        start = time.perf_counter()
+        count = db.add_games(
+            game_entries(args.files), args.batch_size, args.rebuild_index
+        )
+        elapsed = time.perf_counter() - start
+        print(f"Ingested {count} games in {elapsed:.1f}s")
+    else:
+        moves, _ = parse_pdn_moves(args.moves)
+        for game in replay(moves):
+            pass
+        for result, count in db.outcome_stats(game.hash).items():
+            print(f"{result}: {count}")
+    db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,11 @@
-from collections import defaultdict
-import math
-import random
+from collections import defaultdict, namedtuple
+from collections.abc import Iterator
 from pycheckers.ascii import ascii_symbol
 from pycheckers.piece import (
+    RED_KING,
+    RED_MAN,
+    WHITE_KING,
+    WHITE_MAN,
     CheckerColor,
     CheckerLevel,
     CheckerPiece,
@@ -12,6 +15,11 @@ from pycheckers.piece import (
     is_man,
 )
 from pycheckers.square import capture_square, nearby_squares, out_of_bounds
+from pycheckers.variants import ENGLISH, Variant
+from pycheckers.zobrist import WHITE_TURN_KEY, piece_key, position_hash
+
+
+Move = tuple[tuple[int, int], list[tuple[int, int]]]
 
 
 class CheckersException(Exception):
@@ -22,50 +30,77 @@ class BadMoveException(CheckersException):
     pass
 
 
-RED_START_POS = [
-    (0, 5),
-    (2, 5),
-    (4, 5),
-    (6, 5),
-    (1, 6),
-    (3, 6),
-    (5, 6),
-    (7, 6),
-    (0, 7),
-    (2, 7),
-    (4, 7),
-    (6, 7),
-]
-
-WHITE_START_POS = [
-    (1, 0),
-    (3, 0),
-    (5, 0),
-    (7, 0),
-    (0, 1),
-    (2, 1),
-    (4, 1),
-    (6, 1),
-    (1, 2),
-    (3, 2),
-    (5, 2),
-    (7, 2),
-]
+# Start squares of the English variant, kept for existing callers
+RED_START_POS = ENGLISH.start_squares(CheckerColor.RED)
+WHITE_START_POS = ENGLISH.start_squares(CheckerColor.WHITE)
+
+
+# repetitions: draw on the n-th occurrence of the same position
+# quiet_move_limit: plies without a capture or a man move before the game
+# is drawn (the 40-move rule is 40 moves by each side)
+# Either rule is disabled by setting it to 0
+DrawRules = namedtuple(
+    "DrawRules", ["repetitions", "quiet_move_limit"], defaults=[3, 80]
+)
+
+
+DEFAULT_DRAW_RULES = DrawRules()
 
 
 class CheckersGame:
-    def __init__(self, turn: CheckerColor = CheckerColor.RED):
+    __slots__ = (
+        "board",
+        "turn",
+        "draw_rules",
+        "hash",
+        "quiet_plies",
+        "history",
+        "_hash_counts",
+        "variant",
+    )
+
+    def __init__(
+        self,
+        turn: CheckerColor = CheckerColor.RED,
+        draw_rules: DrawRules = DEFAULT_DRAW_RULES,
+        variant: Variant = ENGLISH,
+    ):
         self.board = {}
         self.turn = turn
+        self.draw_rules = draw_rules
+        self.variant = variant
+        self.reset_history()
 
     def copy(self) -> "CheckersGame":
-        new_game = CheckersGame(self.turn)
+        new_game = CheckersGame(self.turn, self.draw_rules, self.variant)
         new_game.board = self.board.copy()
+        new_game.hash = self.hash
+        new_game.quiet_plies = self.quiet_plies
+        new_game.history = self.history.copy()
+        new_game._hash_counts = self._hash_counts.copy()
         return new_game
 
+    def reset_history(self) -> None:
+        # Must be called after modifying the board directly
+        self.hash = position_hash(self.board, self.turn)
+        self.quiet_plies = 0
+        self.history = [self.hash]
+        self._hash_counts = {self.hash: 1}
+
+    def repetition_count(self) -> int:
+        return self._hash_counts.get(self.hash, 0)
+
+    def is_draw(self) -> bool:
+        rules = self.draw_rules
+        if rules.repetitions and self.repetition_count() >= rules.repetitions:
+            return True
+        if rules.quiet_move_limit and self.quiet_plies >= rules.quiet_move_limit:
+            return True
+        return False
+
     def is_over(self) -> bool:
         white_piece_found, red_piece_found = self._colors_on_board()
-        return not white_piece_found or not red_piece_found
+        return not white_piece_found or not red_piece_found or self.is_draw()
 
     def winner(self) -> CheckerColor | None:
         white_piece_found, red_piece_found = self._colors_on_board()
@@ -90,16 +125,22 @@ class CheckersGame:
 
     @classmethod
     def with_board(
-        cls, board: dict, turn: CheckerColor = CheckerColor.RED
+        cls,
+        board: dict,
+        turn: CheckerColor = CheckerColor.RED,
+        draw_rules: DrawRules = DEFAULT_DRAW_RULES,
+        variant: Variant = ENGLISH,
     ) -> "CheckersGame":
-        game = cls(turn)
+        game = cls(turn, draw_rules, variant)
         game.board = board
+        game.reset_history()
         return game
 
     def __str__(self):
         lines = []
-        for y in range(8):
-            symbols = [self._get_ascii_symbol((x, y)) for x in range(8)]
+        size = self.variant.size
+        for y in range(size):
+            symbols = [self._get_ascii_symbol((x, y)) for x in range(size)]
             line = " ".join(symbols)
             lines.append(line)
         return "\n".join(lines)
@@ -137,109 +178,281 @@ class CheckersGame:
         else:
             raise BadMoveException(f"Piece cannot move to ({moves})")
 
-        # Move the piece
+        self.make_move(start, moves)
+
+    def make_move(
+        self, start: tuple[int, int], moves: list[tuple[int, int]]
+    ) -> tuple:
+        # Applies a move without checking that it is legal, returns
+        # the information needed by unmake_move to take it back
+        board = self.board
+        piece = board.pop(start)
+        h = self.hash ^ piece_key(start, piece)
+
+        # Any piece on the diagonal between two squares of the path is
+        # captured: it is the jumped piece of a capture, and only empty
+        # squares are passed over by a (flying) king's quiet move
+        between = self.variant.between
+        captured = []
         prev_move = start
         for move in moves:
-            if is_capture_move(prev_move, move):
-                sq = capture_square(prev_move, move)
-                del self.board[sq]
+            for sq in between[prev_move, move]:
+                captured_piece = board.pop(sq, None)
+                if captured_piece is not None:
+                    captured.append((sq, captured_piece))
+                    h ^= piece_key(sq, captured_piece)
             prev_move = move
 
         final_pos = moves[-1]
-        self.board[final_pos] = piece
-        del self.board[start]
-
-        # Upgrade piece if we reached the end of the board
-        if is_man(piece):
-            if is_red(piece) and final_pos[1] == 0:
-                self.board[final_pos] = CheckerPiece(
-                    CheckerColor.RED, CheckerLevel.KING
-                )
-            elif is_white(piece) and final_pos[1] == 7:
-                self.board[final_pos] = CheckerPiece(
-                    CheckerColor.WHITE, CheckerLevel.KING
-                )
+        final_piece = piece
+
+        # Upgrade piece if the move ended on the far row
+        if is_man(piece) and final_pos[1] == self.variant.promotion_row[piece.color]:
+            final_piece = RED_KING if is_red(piece) else WHITE_KING
+
+        board[final_pos] = final_piece
+        self.hash = h ^ piece_key(final_pos, final_piece)
+
+        undo = (start, final_pos, piece, captured, self.quiet_plies)
+        if captured or is_man(piece):
+            self.quiet_plies = 0
+        else:
+            self.quiet_plies += 1
 
         self.next_turn()
+        self.history.append(self.hash)
+        self._hash_counts[self.hash] = self._hash_counts.get(self.hash, 0) + 1
+        return undo
+
+    def unmake_move(self, undo: tuple) -> None:
+        start, final_pos, piece, captured, quiet_plies = undo
+
+        count = self._hash_counts[self.hash] - 1
+        if count:
+            self._hash_counts[self.hash] = count
+        else:
+            del self._hash_counts[self.hash]
+        self.history.pop()
+        self.hash = self.history[-1]
+
+        board = self.board
+        del board[final_pos]
+        for sq, captured_piece in captured:
+            board[sq] = captured_piece
+        board[start] = piece
+
+        self.quiet_plies = quiet_plies
+        self.turn = (
+            CheckerColor.RED if self.turn == CheckerColor.WHITE else CheckerColor.WHITE
+        )
 
     def next_turn(self) -> None:
         if self.turn == CheckerColor.WHITE:
             self.turn = CheckerColor.RED
         else:
             self.turn = CheckerColor.WHITE
+        self.hash ^= WHITE_TURN_KEY
 
 
-def initial_setup_board() -> CheckersGame:
+def initial_setup_board(variant: Variant = ENGLISH) -> CheckersGame:
     return CheckersGame.with_board(
         {
-            **{
-                pos: CheckerPiece(CheckerColor.RED, CheckerLevel.MAN)
-                for pos in RED_START_POS
-            },
-            **{
-                pos: CheckerPiece(CheckerColor.WHITE, CheckerLevel.MAN)
-                for pos in WHITE_START_POS
-            },
-        }
+            **{pos: RED_MAN for pos in variant.start_squares(CheckerColor.RED)},
+            **{pos: WHITE_MAN for pos in variant.start_squares(CheckerColor.WHITE)},
+        },
+        variant=variant,
     )
 
 
 def legal_moves(game: CheckersGame) -> dict:  # TODO: add a cache
-    with_captures = defaultdict(list)
-    without_captures = defaultdict(list)
-
-    current_turn = game.turn
+    moves = defaultdict(list)
+    for position, path in iter_moves(game):
+        moves[position].append(path)
+    return moves
 
-    for position, piece in game.board.items():
-        if piece.color != current_turn:
-            continue
 
-        for sq in nearby_squares(piece, position):
-            if out_of_bounds(sq):
-                continue
+def capture_moves(game: CheckersGame) -> dict:
+    moves = defaultdict(list)
+    for position, path in iter_captures(game):
+        moves[position].append(path)
+    return moves
 
-            if not with_captures and is_empty(game, sq):
-                without_captures[position].append([sq])
-                continue
 
-            # Check nearby squares if we can capture something
-            capture_sq = get_capture_sq(game, piece, position, sq)
-            if not capture_sq:
-                continue
-
-            # If we can capture something, recursively find all possible moves
-            capture_paths = []
-            _find_capture_paths(game, piece, [capture_sq], capture_paths)
-            if capture_paths:
-                with_captures[position].extend(capture_paths)
-    if with_captures:
-        return with_captures
+def iter_moves(
+    game: CheckersGame,
+    killers: list[Move] = (),
+    history: dict | None = None,
+    hash_move: Move | None = None,
+) -> Iterator[Move]:
+    # Yields legal moves lazily: captures first (when there are any, they
+    # are the only legal moves), then killer moves that are legal here,
+    # then the remaining quiet moves ordered by history score. A hash move
+    # (the best move found for this position by an earlier search) comes
+    # before all of them if it is legal. The game may be modified between
+    # yields as long as it is restored before the next move is requested.
+    pieces = _pieces_to_move(game)
+
+    if hash_move is None:
+        has_captures = False
+        for move in _iter_captures(game, pieces):
+            has_captures = True
+            yield move
+        if has_captures:
+            return
     else:
-        return without_captures
+        captures = list(_iter_captures(game, pieces))
+        if captures:
+            if hash_move in captures:
+                yield hash_move
+            for move in captures:
+                if move != hash_move:
+                    yield move
+            return
+        if _is_quiet_move(game, hash_move):
+            yield hash_move
+
+    for killer in killers:
+        if killer != hash_move and _is_quiet_move(game, killer):
+            yield killer
+
+    quiet_moves = [
+        (position, [sq])
+        for position, piece in pieces
+        for sq in _quiet_squares(game, piece, position)
+    ]
+    if history:
+        quiet_moves.sort(key=lambda m: history.get((m[0], m[1][0]), 0), reverse=True)
+    for move in quiet_moves:
+        if move not in killers and move != hash_move:
+            yield move
+
+
+def iter_captures(game: CheckersGame) -> Iterator[Move]:
+    return _iter_captures(game, _pieces_to_move(game))
+
+
+def _pieces_to_move(game: CheckersGame) -> list[tuple[tuple[int, int], CheckerPiece]]:
+    current_turn = game.turn
+    return [
+        (position, piece)
+        for position, piece in game.board.items()
+        if piece.color == current_turn
+    ]
+
+
+def _quiet_squares(
+    game: CheckersGame, piece: CheckerPiece, position: tuple[int, int]
+) -> list[tuple[int, int]]:
+    board = game.board
+    variant = game.variant
+    if variant.flying_kings and is_king(piece):
+        squares = []
+        for ray in variant.rays[position].values():
+            for sq in ray:
+                if sq in board:
+                    break
+                squares.append(sq)
+        return squares
+    return [sq for sq in variant.steps[piece][position] if sq not in board]
+
+
+def _iter_captures(
+    game: CheckersGame, pieces: list[tuple[tuple[int, int], CheckerPiece]]
+) -> Iterator[Move]:
+    if game.variant.maximum_capture:
+        yield from _maximum_captures(game, pieces)
+        return
+
+    for position, piece in pieces:
+        # If we can capture something, recursively find all possible moves
+        capture_paths = []
+        _find_capture_paths(game, piece, position, position, [], (), capture_paths)
+        for path in capture_paths:
+            yield position, path
+
+
+def _maximum_captures(
+    game: CheckersGame, pieces: list[tuple[tuple[int, int], CheckerPiece]]
+) -> list[Move]:
+    # Only the sequences capturing the most pieces are legal, so every
+    # sequence has to be found before any of them can be returned
+    captures = []
+    for position, piece in pieces:
+        capture_paths = []
+        _find_capture_paths(game, piece, position, position, [], (), capture_paths)
+        captures.extend((position, path) for path in capture_paths)
+    if not captures:
+        return captures
+    most = max(len(path) for _, path in captures)
+    return [move for move in captures if len(move[1]) == most]
+
+
+def _is_quiet_move(game: CheckersGame, move: Move) -> bool:
+    position, path = move
+    piece = game.board.get(position)
+    if piece is None or piece.color != game.turn or len(path) != 1:
+        return False
+    return path[0] in _quiet_squares(game, piece, position)
 
 
 def _find_capture_paths(
     game: CheckersGame,
     piece: CheckerPiece,
+    start: tuple[int, int],
+    pos: tuple[int, int],
     path: list[tuple[int, int]],
+    captured: tuple[tuple[int, int], ...],
     all_paths: list[list[tuple[int, int]]],
 ):
-    start = path[-1]
+    # Captured pieces stay on the board until the move is complete: they
+    # cannot be jumped twice and block the way. The capturing piece has
+    # left its start square, so that square counts as empty.
+    board = game.board
+    variant = game.variant
 
     end_of_path = True
-    for sq in nearby_squares(piece, start):
-        capture_sq = get_capture_sq(game, piece, start, sq)
-        if not capture_sq:
-            continue
-        elif capture_sq in path:
-            continue
-        else:
-            path_new = path + [capture_sq]
-            _find_capture_paths(game, piece, path_new, all_paths)
+    if variant.flying_kings and is_king(piece):
+        for ray in variant.rays[pos].values():
+            for i, sq in enumerate(ray):
+                if sq in board and sq != start:
+                    break
+            else:
+                continue
+            if board[sq].color == piece.color or sq in captured:
+                continue
+            for landing in ray[i + 1 :]:
+                if landing in board and landing != start:
+                    break
+                _find_capture_paths(
+                    game,
+                    piece,
+                    start,
+                    landing,
+                    path + [landing],
+                    captured + (sq,),
+                    all_paths,
+                )
+                end_of_path = False
+    else:
+        for sq, landing in variant.jumps[piece][pos]:
+            other_piece = board.get(sq)
+            if other_piece is None or other_piece.color == piece.color:
+                continue
+            if sq in captured or (landing in board and landing != start):
+                continue
+            _find_capture_paths(
+                game,
+                piece,
+                start,
+                landing,
+                path + [landing],
+                captured + (sq,),
+                all_paths,
+            )
             end_of_path = False
 
     # this tells us we recursed to the end of the capture path
-    if end_of_path:
+    if end_of_path and path:
         all_paths.append(path)
 
 
@@ -249,6 +462,9 @@ def get_capture_sq(
     pos: tuple[int, int],
     other_pos: tuple[int, int],
 ) -> tuple[int, int] | None:
+    # The landing square of a short jump from pos over other_pos, None if
+    # the jump isn't possible. Move generation uses the variant's jump
+    # tables instead.
     if is_empty(game, other_pos):
         return None
 
@@ -265,7 +481,7 @@ def get_capture_sq(
     x1, y1 = other_pos
     square_to_check = (x1 + (x1 - x), y1 + (y1 - y))
 
-    if out_of_bounds(square_to_check):
+    if not game.variant.geometry.in_bounds(square_to_check):
         return None
 
     if not is_empty(game, square_to_check):
@@ -279,10 +495,14 @@ def is_empty(game: CheckersGame, pos: tuple[int, int]) -> bool:
 
 
 def is_capture_move(start: tuple[int, int], end: tuple[int, int]) -> bool:
+    # Only meaningful for pieces that move one square at a time, a flying
+    # king's capture can't be told from its squares
     return abs(end[0] - start[0]) == 2
 
 
 def random_move(game: CheckersGame) -> None:
+    import random
+
     by_position = legal_moves(game)
     all_moves = []
     for position, moves in by_position.items():
@@ -1,4 +1,5 @@
-from pycheckers.game import *
+from pycheckers.game import CheckersGame
+from pycheckers.piece import CheckerColor, CheckerLevel, CheckerPiece
 from pycheckers.svg import render
 
 
@@ -0,0 +1,299 @@
+import argparse
+import math
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Callable
+from pycheckers.game import CheckersGame, Move, initial_setup_board, legal_moves
+from pycheckers.minimax import SearchStats, board_value, minimax
+from pycheckers.piece import CheckerColor
+from pycheckers.variants import ENGLISH, VARIANTS, Variant
+
+# z-value for a two-sided 95% confidence interval
+Z_95 = 1.959964
+
+
+@dataclass(frozen=True)
+class EngineConfig:
+    name: str
+    depth: int
+    evaluator: Callable[[CheckersGame], int] = board_value
+    quiescence_nodes: int = 10_000
+    alpha_beta: bool = True
+
+
+@dataclass
+class EngineTally:
+    moves: int = 0
+    seconds: float = 0.0
+    nodes: int = 0
+
+    def add(self, other: "EngineTally") -> None:
+        self.moves += other.moves
+        self.seconds += other.seconds
+        self.nodes += other.nodes
+
+    @property
+    def seconds_per_move(self) -> float:
+        return self.seconds / self.moves if self.moves else 0.0
+
+    @property
+    def nodes_per_second(self) -> float:
+        return self.nodes / self.seconds if self.seconds else 0.0
+
+
+@dataclass
+class GameRecord:
+    opening: tuple[Move, ...]
+    engine_a_color: CheckerColor
+    winner: CheckerColor | None
+    plies: int
+    engine_a: EngineTally
+    engine_b: EngineTally
+    # Moves played by the engines after the opening
+    moves: list[Move] = field(default_factory=list)
+
+    @property
+    def score(self) -> float:
+        # Score of engine A: 1 for a win, 0.5 for a draw, 0 for a loss
+        if self.winner is None:
+            return 0.5
+        return 1.0 if self.winner == self.engine_a_color else 0.0
+
+
+@dataclass
+class MatchResult:
+    engine_a: EngineConfig
+    engine_b: EngineConfig
+    games: list[GameRecord] = field(default_factory=list)
+
+    @property
+    def wins(self) -> int:
+        return sum(1 for g in self.games if g.score == 1.0)
+
+    @property
+    def draws(self) -> int:
+        return sum(1 for g in self.games if g.score == 0.5)
+
+    @property
+    def losses(self) -> int:
+        return sum(1 for g in self.games if g.score == 0.0)
+
+    @property
+    def score(self) -> float:
+        if not self.games:
+            return 0.5
+        return sum(g.score for g in self.games) / len(self.games)
+
+    def confidence_interval(self, z: float = Z_95) -> tuple[float, float]:
+        n = len(self.games)
+        if n < 2:
+            return 0.0, 1.0
+        mean = self.score
+        variance = sum((g.score - mean) ** 2 for g in self.games) / (n - 1)
+        margin = z * math.sqrt(variance / n)
+        return max(0.0, mean - margin), min(1.0, mean + margin)
+
+    def elo(self) -> tuple[float, float, float]:
+        low, high = self.confidence_interval()
+        return score_to_elo(low), score_to_elo(self.score), score_to_elo(high)
+
+    def tally(self, engine_a: bool) -> EngineTally:
+        total = EngineTally()
+        for g in self.games:
+            total.add(g.engine_a if engine_a else g.engine_b)
+        return total
+
+    def report(self) -> str:
+        low, high = self.confidence_interval()
+        elo_low, elo, elo_high = self.elo()
+        lines = [
+            f"{self.engine_a.name} vs {self.engine_b.name}: {len(self.games)} games",
+            f"W/D/L: {self.wins}/{self.draws}/{self.losses}",
+            f"Score: {self.score:.3f} (95% CI {low:.3f} - {high:.3f})",
+            f"Elo: {elo:+.1f} (95% CI {elo_low:+.1f} - {elo_high:+.1f})",
+        ]
+        for engine, tally in (
+            (self.engine_a, self.tally(True)),
+            (self.engine_b, self.tally(False)),
+        ):
+            lines.append(
+                f"{engine.name}: {tally.seconds_per_move * 1000:.1f} ms/move, "
+                f"{tally.nodes_per_second:.0f} nodes/s"
+            )
+        return "\n".join(lines)
+
+
+def score_to_elo(score: float) -> float:
+    if score <= 0.0:
+        return -math.inf
+    if score >= 1.0:
+        return math.inf
+    return -400 * math.log10(1 / score - 1)
+
+
+def ballot_openings(
+    plies: int = 2, variant: Variant = ENGLISH
+) -> list[tuple[Move, ...]]:
+    openings = []
+    _extend_openings(initial_setup_board(variant), (), plies, openings)
+    return openings
+
+
+def _extend_openings(
+    game: CheckersGame,
+    opening: tuple[Move, ...],
+    plies: int,
+    openings: list[tuple[Move, ...]],
+) -> None:
+    if plies == 0:
+        openings.append(opening)
+        return
+    for pos, paths in legal_moves(game).items():
+        for path in paths:
+            new_game = game.copy()
+            new_game.move(pos, path)
+            _extend_openings(new_game, opening + ((pos, path),), plies - 1, openings)
+
+
+def play_game(
+    engine_a: EngineConfig,
+    engine_b: EngineConfig,
+    opening: tuple[Move, ...],
+    engine_a_color: CheckerColor,
+    max_plies: int = 200,
+    variant: Variant = ENGLISH,
+) -> GameRecord:
+    game = initial_setup_board(variant)
+    for pos, path in opening:
+        game.move(pos, path)
+
+    engine_b_color = (
+        CheckerColor.WHITE if engine_a_color == CheckerColor.RED else CheckerColor.RED
+    )
+    engines = {engine_a_color: engine_a, engine_b_color: engine_b}
+    tallies = {engine_a_color: EngineTally(), engine_b_color: EngineTally()}
+
+    plies = len(opening)
+    moves = []
+    winner = None
+    while True:
+        if game.is_over():
+            winner = game.winner()
+            break
+        if not legal_moves(game):
+            # A side that cannot move loses
+            winner = (
+                CheckerColor.WHITE
+                if game.turn == CheckerColor.RED
+                else CheckerColor.RED
+            )
+            break
+        if plies >= max_plies:
+            # Adjudicate overly long games as draws
+            break
+
+        engine = engines[game.turn]
+        stats = SearchStats()
+        start = time.perf_counter()
+        _, pos, path = minimax(
+            game,
+            engine.depth,
+            game.turn == CheckerColor.WHITE,
+            evaluator=engine.evaluator,
+            stats=stats,
+            verbose=False,
+            quiescence_nodes=engine.quiescence_nodes,
+            alpha_beta=engine.alpha_beta,
+        )
+        tally = tallies[game.turn]
+        tally.seconds += time.perf_counter() - start
+        tally.nodes += stats.nodes + stats.quiescence_nodes
+        tally.moves += 1
+
+        game.move(pos, path)
+        moves.append((pos, path))
+        plies += 1
+
+    return GameRecord(
+        opening,
+        engine_a_color,
+        winner,
+        plies,
+        tallies[engine_a_color],
+        tallies[engine_b_color],
+        moves,
+    )
+
+
+def _play_job(args: tuple) -> GameRecord:
+    return play_game(*args)
+
+
+def run_match(
+    engine_a: EngineConfig,
+    engine_b: EngineConfig,
+    openings: list[tuple[Move, ...]] | None = None,
+    workers: int | None = None,
+    max_plies: int = 200,
+    variant: Variant = ENGLISH,
+) -> MatchResult:
+    if openings is None:
+        openings = ballot_openings(variant=variant)
+
+    # Every opening is played twice, once with each engine as red
+    jobs = [
+        (engine_a, engine_b, opening, color, max_plies, variant)
+        for opening in openings
+        for color in (CheckerColor.RED, CheckerColor.WHITE)
+    ]
+
+    result = MatchResult(engine_a, engine_b)
+    if workers == 1:
+        result.games.extend(map(_play_job, jobs))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            result.games.extend(executor.map(_play_job, jobs))
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Play two engine configurations against each other"
+    )
+    parser.add_argument("--depth-a", type=int, default=2)
+    parser.add_argument("--depth-b", type=int, default=2)
+    parser.add_argument(
+        "--qnodes-a", type=int, default=10_000, help="0 disables quiescence"
+    )
+    parser.add_argument(
+        "--qnodes-b", type=int, default=10_000, help="0 disables quiescence"
+    )
+    parser.add_argument(
+        "--opening-plies", type=int, default=2, help="length of ballot openings"
+    )
+    parser.add_argument("--max-plies", type=int, default=200)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--variant", choices=VARIANTS, default=ENGLISH.name)
+    args = parser.parse_args()
+    variant = VARIANTS[args.variant]
+
+    engine_a = EngineConfig(
+        f"A (depth {args.depth_a})", args.depth_a, quiescence_nodes=args.qnodes_a
+    )
+    engine_b = EngineConfig(
+        f"B (depth {args.depth_b})", args.depth_b, quiescence_nodes=args.qnodes_b
+    )
+    result = run_match(
+        engine_a,
+        engine_b,
+        openings=ballot_openings(args.opening_plies, variant),
+        workers=args.workers,
+        max_plies=args.max_plies,
+        variant=variant,
+    )
+    print(result.report())
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,14 @@
+import itertools
 import math
-from pycheckers.game import CheckersGame, legal_moves
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import Callable
+from pycheckers.game import (
+    CheckersGame,
+    Move,
+    iter_captures,
+    iter_moves,
+)
 from pycheckers.piece import CheckerColor, is_white, is_red, is_king
 
 
@@ -27,53 +36,357 @@ def board_value(game: CheckersGame) -> int:
     return ret
 
 
+@dataclass
+class SearchStats:
+    nodes: int = 0
+    cutoffs: int = 0
+    table_hits: int = 0
+    quiescence_nodes: int = 0
+    quiescence_depth: int = 0
+    quiescence_limit_hits: int = 0
+
+
+# Transposition table entries are (depth, value, bound, best move)
+EXACT = 0
+LOWER_BOUND = 1
+UPPER_BOUND = 2
+
+# The table is cleared when it grows past this many positions
+TABLE_SIZE = 1_000_000
+
+
+@dataclass
+class AnalysisLine:
+    score: int
+    moves: list[Move]
+    # The moves in PDN notation, e.g. ["22-18", "11-15"]
+    pv: list[str]
+    depth: int
+    # Nodes searched below this line's first move, including quiescence
+    nodes: int
+
+
+@dataclass
+class _Search:
+    evaluator: Callable[[CheckersGame], int]
+    stats: SearchStats = field(default_factory=SearchStats)
+    verbose: bool = True
+    draw_score: int = 0
+    quiescence_nodes: int = 10_000
+    alpha_beta: bool = True
+    # Quiet moves that caused a cutoff, per ply
+    killers: dict = field(default_factory=lambda: defaultdict(list))
+    # Cutoff counts of quiet moves, keyed by (start, destination)
+    history: dict = field(default_factory=dict)
+    # Transposition table keyed by position hash, None disables it
+    table: dict | None = None
+
+
 def minimax(
-    game: CheckersGame, depth: int, maximising_player: bool
+    game: CheckersGame,
+    depth: int,
+    maximising_player: bool,
+    evaluator: Callable[[CheckersGame], int] = board_value,
+    stats: SearchStats | None = None,
+    verbose: bool = True,
+    draw_score: int = 0,
+    quiescence_nodes: int = 10_000,
+    alpha_beta: bool = True,
+    table: dict | None = None,
 ) -> tuple[int, tuple[int, int] | None, list[tuple[int, int]] | None]:
-    return _minimax_internal(game, depth, maximising_player, depth)
+    search = _Search(
+        evaluator,
+        stats if stats is not None else SearchStats(),
+        verbose,
+        draw_score,
+        quiescence_nodes,
+        alpha_beta,
+        table=table,
+    )
+    value, pv = _minimax_internal(
+        game, depth, maximising_player, depth, search, -math.inf, math.inf
+    )
+    if not pv:
+        return value, None, None
+    pos, path = pv[0]
+    return value, pos, path
+
+
+def analyse(
+    game: CheckersGame,
+    depth: int,
+    multipv: int = 1,
+    evaluator: Callable[[CheckersGame], int] = board_value,
+    stats: SearchStats | None = None,
+    draw_score: int = 0,
+    quiescence_nodes: int = 10_000,
+    table: dict | None = None,
+) -> list[AnalysisLine]:
+    # Finds the best multipv moves for the side to move, best first, each
+    # with its principal variation, in one search of the root moves: once
+    # multipv lines are known, the other moves are searched with a window
+    # that only admits moves better than the worst of them. Scores are from
+    # white's point of view, as with minimax.
+    #
+    # A table can be passed in to keep between calls, but only for
+    # positions of the same game: repetitions are scored as draws using
+    # the game's history, and those scores are stored in the table.
+    if multipv < 1:
+        raise ValueError(f"multipv must be at least 1, not {multipv}")
+    search = _Search(
+        evaluator,
+        stats if stats is not None else SearchStats(),
+        False,
+        draw_score,
+        quiescence_nodes,
+        table=table if table is not None else {},
+    )
+    maximising_player = game.turn == CheckerColor.WHITE
+    scored = _search_root(
+        game, list(iter_moves(game)), depth, maximising_player, multipv, search
+    )
+    return [
+        AnalysisLine(value, pv, _pv_to_pdn(game, pv), depth, nodes)
+        for value, pv, nodes in scored
+    ]
+
+
+def _search_root(
+    game: CheckersGame,
+    root_moves: list[Move],
+    depth: int,
+    maximising_player: bool,
+    multipv: int,
+    search: _Search,
+) -> list[tuple[int, list[Move], int]]:
+    # Keeps the best multipv (value, pv, nodes) triples, best first. Once
+    # there are multipv of them, the rest are searched with a window that
+    # only lets through moves better than the worst of them.
+    stats = search.stats
+    scored = []
+    for move in root_moves:
+        alpha, beta = -math.inf, math.inf
+        if len(scored) == multipv:
+            bound = scored[-1][0]
+            if maximising_player:
+                alpha = bound
+            else:
+                beta = bound
+
+        start_nodes = stats.nodes + stats.quiescence_nodes
+        undo = game.make_move(*move)
+        value, pv = _minimax_internal(
+            game, depth - 1, not maximising_player, depth, search, alpha, beta
+        )
+        game.unmake_move(undo)
+        nodes = stats.nodes + stats.quiescence_nodes - start_nodes
+
+        if len(scored) == multipv and not alpha < value < beta:
+            continue
+        scored.append((value, [move] + pv, nodes))
+        # Stable sort: between equal scores, the move searched first wins
+        scored.sort(key=lambda s: -s[0] if maximising_player else s[0])
+        del scored[multipv:]
+
+    for _, pv, _ in scored:
+        _extend_pv(game, pv, depth, search)
+    return scored
+
+
+def _extend_pv(
+    game: CheckersGame, pv: list[Move], depth: int, search: _Search
+) -> None:
+    # Lines cut short by transposition table hits are completed by
+    # following the best moves stored in the table
+    undos = [game.make_move(*move) for move in pv]
+    while len(pv) < depth and not game.is_over():
+        entry = search.table.get(game.hash)
+        if entry is None or entry[3] is None or entry[3] not in iter_moves(game):
+            break
+        pv.append(entry[3])
+        undos.append(game.make_move(*entry[3]))
+    for undo in reversed(undos):
+        game.unmake_move(undo)
+
+
+def _pv_to_pdn(game: CheckersGame, pv: list[Move]) -> list[str]:
+    from pycheckers.read_and_play import game_move_to_pdn
+
+    notation = []
+    undos = []
+    for pos, path in pv:
+        notation.append(game_move_to_pdn(game, pos, path))
+        undos.append(game.make_move(pos, path))
+    for undo in reversed(undos):
+        game.unmake_move(undo)
+    return notation
 
 
 def _minimax_internal(
-    game: CheckersGame, depth: int, maximising_player: bool, max_depth: int
-) -> tuple[int, tuple[int, int] | None, list[tuple[int, int]] | None]:
-    if depth == 0 or game.is_over():
-        return board_value(game), None, None
+    game: CheckersGame,
+    depth: int,
+    maximising_player: bool,
+    max_depth: int,
+    search: _Search,
+    alpha: float,
+    beta: float,
+) -> tuple[int, list[Move]]:
+    # Returns the value of the position and its principal variation
+    search.stats.nodes += 1
+    # Any repetition inside the search tree is scored as a draw, since
+    # the side that could avoid it would have done so
+    if game.is_draw() or (depth != max_depth and game.repetition_count() > 1):
+        return search.draw_score, []
+    if game.is_over():
+        return search.evaluator(game), []
+    if depth == 0:
+        if search.quiescence_nodes:
+            value = _quiescence(game, maximising_player, search, 1, alpha, beta)
+            return value, []
+        return search.evaluator(game), []
 
-    best_pos = None
-    best_path = None
+    table = search.table
+    hash_move = None
+    if table is not None:
+        entry = table.get(game.hash)
+        if entry is not None:
+            entry_depth, entry_value, bound, hash_move = entry
+            if depth != max_depth and entry_depth >= depth:
+                if bound == EXACT:
+                    search.stats.table_hits += 1
+                    return entry_value, []
+                elif bound == LOWER_BOUND:
+                    alpha = max(alpha, entry_value)
+                else:
+                    beta = min(beta, entry_value)
+                if alpha >= beta:
+                    search.stats.table_hits += 1
+                    return entry_value, []
+    original_alpha, original_beta = alpha, beta
+
+    best_pv = []
+    verbose = search.verbose and depth == max_depth
+    ply = max_depth - depth
+    killers = search.killers[ply]
+    moves = iter_moves(game, killers, search.history, hash_move)
 
     if maximising_player:
         best_value = -math.inf
 
-        moves = legal_moves(game)
-
-        for pos, paths in moves.items():
-            for path in paths:
-                new_game = game.copy()
-                new_game.move(pos, path)
-                value, _, _ = _minimax_internal(new_game, depth - 1, False, max_depth)
-                if depth == max_depth:
-                    print(value, pos, path)
-                if value > best_value:
-                    best_value = value
-                    best_pos = pos
-                    best_path = path
+        for pos, path in moves:
+            undo = game.make_move(pos, path)
+            value, pv = _minimax_internal(
+                game, depth - 1, False, max_depth, search, alpha, beta
+            )
+            game.unmake_move(undo)
+            if verbose:
+                print(value, pos, path)
+            if value > best_value or not best_pv:
+                best_value = value
+                best_pv = [(pos, path)] + pv
+            if search.alpha_beta:
+                alpha = max(alpha, best_value)
+                if alpha >= beta:
+                    _record_cutoff(search, killers, pos, path, undo, depth)
+                    break
     else:
         best_value = math.inf
 
-        moves = legal_moves(game)
-
-        for pos, paths in moves.items():
-            for path in paths:
-                new_game = game.copy()
-                new_game.move(pos, path)
-                value, _, _ = _minimax_internal(new_game, depth - 1, True, max_depth)
-                if depth == max_depth:
-                    print(value, pos, path)
-                if value < best_value:
-                    best_value = value
-                    best_pos = pos
-                    best_path = path
-    if depth == max_depth:
+        for pos, path in moves:
+            undo = game.make_move(pos, path)
+            value, pv = _minimax_internal(
+                game, depth - 1, True, max_depth, search, alpha, beta
+            )
+            game.unmake_move(undo)
+            if verbose:
+                print(value, pos, path)
+            if value < best_value or not best_pv:
+                best_value = value
+                best_pv = [(pos, path)] + pv
+            if search.alpha_beta:
+                beta = min(beta, best_value)
+                if alpha >= beta:
+                    _record_cutoff(search, killers, pos, path, undo, depth)
+                    break
+    if verbose:
+        best_pos, best_path = best_pv[0] if best_pv else (None, None)
         print(f"Picked move: {best_value}, {best_pos}, {best_path}")
-    return best_value, best_pos, best_path
+
+    if table is not None and best_pv:
+        if best_value <= original_alpha:
+            bound = UPPER_BOUND
+        elif best_value >= original_beta:
+            bound = LOWER_BOUND
+        else:
+            bound = EXACT
+        if len(table) >= TABLE_SIZE:
+            table.clear()
+        table[game.hash] = (depth, best_value, bound, best_pv[0])
+    return best_value, best_pv
+
+
+def _record_cutoff(
+    search: _Search,
+    killers: list[Move],
+    pos: tuple[int, int],
+    path: list[tuple[int, int]],
+    undo: tuple,
+    depth: int,
+) -> None:
+    search.stats.cutoffs += 1
+    # Only quiet moves are remembered, undo[3] lists the captured pieces
+    if undo[3]:
+        return
+    move = (pos, path)
+    if move not in killers:
+        killers.insert(0, move)
+        del killers[2:]
+    key = (pos, path[0])
+    search.history[key] = search.history.get(key, 0) + depth * depth
+
+
+def _quiescence(
+    game: CheckersGame,
+    maximising_player: bool,
+    search: _Search,
+    ply: int,
+    alpha: float,
+    beta: float,
+) -> int:
+    # Captures are mandatory, so a position with a capture pending is not
+    # quiet and there is no option to stand pat: keep searching the forced
+    # capture sequences until the side to move has none left. Captures are
+    # irreversible, so repetitions cannot occur here.
+    if game.is_over():
+        return search.evaluator(game)
+
+    moves = iter_captures(game)
+    first_move = next(moves, None)
+    if first_move is None:
+        return search.evaluator(game)
+
+    stats = search.stats
+    if stats.quiescence_nodes >= search.quiescence_nodes:
+        stats.quiescence_limit_hits += 1
+        return search.evaluator(game)
+
+    stats.quiescence_nodes += 1
+    stats.quiescence_depth = max(stats.quiescence_depth, ply)
+
+    best_value = -math.inf if maximising_player else math.inf
+    for pos, path in itertools.chain([first_move], moves):
+        undo = game.make_move(pos, path)
+        value = _quiescence(
+            game, not maximising_player, search, ply + 1, alpha, beta
+        )
+        game.unmake_move(undo)
+        if maximising_player:
+            best_value = max(best_value, value)
+            alpha = max(alpha, best_value)
+        else:
+            best_value = min(best_value, value)
+            beta = min(beta, best_value)
+        if search.alpha_beta and alpha >= beta:
+            stats.cutoffs += 1
+            break
+    return best_value
@@ -1,5 +1,4 @@
 from enum import Enum, auto
-from dataclasses import dataclass
 
 
 class CheckerColor(Enum):
@@ -12,10 +11,39 @@ class CheckerLevel(Enum):
     KING = auto()
 
 
-@dataclass(frozen=True)
 class CheckerPiece:
-    color: CheckerColor
-    level: CheckerLevel
+    # Only four distinct pieces exist, so instances are interned: the
+    # constructor always returns the shared instance for a colour and
+    # level, and pieces can be compared and hashed by identity. This is
+    # a plain class rather than a dataclass to keep imports light.
+    __slots__ = ("color", "level")
+
+    def __new__(cls, color: CheckerColor, level: CheckerLevel) -> "CheckerPiece":
+        try:
+            return _PIECES[color, level]
+        except KeyError:
+            piece = object.__new__(cls)
+            object.__setattr__(piece, "color", color)
+            object.__setattr__(piece, "level", level)
+            _PIECES[color, level] = piece
+            return piece
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"cannot assign to field '{name}'")
+
+    def __reduce__(self):
+        return CheckerPiece, (self.color, self.level)
+
+    def __repr__(self):
+        return f"CheckerPiece(color={self.color!r}, level={self.level!r})"
+
+
+_PIECES = {}
+
+RED_MAN = CheckerPiece(CheckerColor.RED, CheckerLevel.MAN)
+RED_KING = CheckerPiece(CheckerColor.RED, CheckerLevel.KING)
+WHITE_MAN = CheckerPiece(CheckerColor.WHITE, CheckerLevel.MAN)
+WHITE_KING = CheckerPiece(CheckerColor.WHITE, CheckerLevel.KING)
 
 
 def is_man(piece: CheckerPiece) -> bool:
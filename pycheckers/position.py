@@ -0,0 +1,56 @@
+from pycheckers.game import DEFAULT_DRAW_RULES, CheckersGame, DrawRules
+from pycheckers.piece import (
+    RED_KING,
+    RED_MAN,
+    WHITE_KING,
+    WHITE_MAN,
+    CheckerColor,
+)
+from pycheckers.variants import ENGLISH, Variant
+
+PIECE_CODES = {RED_MAN: 1, RED_KING: 2, WHITE_MAN: 3, WHITE_KING: 4}
+CODE_PIECES = {code: piece for piece, code in PIECE_CODES.items()}
+
+TURN_CODES = {CheckerColor.RED: 0, CheckerColor.WHITE: 1}
+CODE_TURNS = {code: turn for turn, code in TURN_CODES.items()}
+
+
+class PackedPosition(bytes):
+    # A position stored as one byte per playable square, in PDN square
+    # number order, followed by the side to move: a single immutable object
+    # (33 bytes of data on 8x8) that can be hashed, compared and used as a
+    # dict key or set member, instead of a game object holding a dict of
+    # tuples. The variant is not stored, so it has to be passed back in
+    # when unpacking.
+    __slots__ = ()
+
+    @classmethod
+    def from_game(cls, game: CheckersGame) -> "PackedPosition":
+        geometry = game.variant.geometry
+        data = bytearray(len(geometry.squares) + 1)
+        square_numbers = geometry.square_numbers
+        for pos, piece in game.board.items():
+            data[square_numbers[pos] - 1] = PIECE_CODES[piece]
+        data[-1] = TURN_CODES[game.turn]
+        return cls(data)
+
+    @property
+    def turn(self) -> CheckerColor:
+        return CODE_TURNS[self[-1]]
+
+    def board(self, variant: Variant = ENGLISH) -> dict:
+        squares = variant.geometry.squares
+        return {
+            squares[i]: CODE_PIECES[code]
+            for i, code in enumerate(self[:-1])
+            if code
+        }
+
+    def to_game(
+        self,
+        draw_rules: DrawRules = DEFAULT_DRAW_RULES,
+        variant: Variant = ENGLISH,
+    ) -> CheckersGame:
+        return CheckersGame.with_board(
+            self.board(variant), self.turn, draw_rules, variant
+        )
@@ -1,30 +1,167 @@
-from pycheckers.game import initial_setup_board, square_number_to_pos
+from collections.abc import Iterable, Iterator
+from pycheckers.game import CheckersGame, Move, initial_setup_board
+from pycheckers.variants import ENGLISH, Variant
+
+RESULTS = ("1-0", "0-1", "1/2-1/2", "*")
+
+
+def open_pdn(filename: str):
+    # PDN archives are often Latin-1 rather than UTF-8. Moves are plain
+    # ASCII, so undecodable bytes (which can only be in tags or comments)
+    # are replaced rather than failing the whole file.
+    return open(filename, "r", encoding="utf-8", errors="replace")
 
 
 def read_checkers_pdn(filename: str):
-    move_lines = []
-    with open(filename, "r") as f:
-        for line in f:
-            line = line.rstrip()
-            if not line.startswith("["):
-                move_lines.append(line)
+    with open_pdn(filename) as f:
+        for moves, _ in parse_pdn_games(f):
+            return moves
+    return []
+
+
+def read_pdn_games(filename: str) -> Iterator[tuple[list, str | None]]:
+    with open_pdn(filename) as f:
+        yield from parse_pdn_games(f)
+
+
+def parse_pdn_games(lines: Iterable[str]) -> Iterator[tuple[list, str | None]]:
+    # Yields (moves, result) for every game in a PDN archive
+    for move_text, tag_result in split_pdn_games(lines):
+        yield parse_pdn_game(move_text, tag_result)
+
+
+def split_pdn_games(lines: Iterable[str]) -> Iterator[tuple[str, str | None]]:
+    # Yields (move text, Result tag) for every game in a PDN archive,
+    # without parsing the moves, so that callers can skip a malformed game
+    # and carry on with the next. A game ends at its result token, at a
+    # blank line following its move text, or when the tags of the next
+    # game start. Comments are removed from the move text.
+    tokens = []
+    result = None
+    in_comment = False
+    for line in lines:
+        if not in_comment:
+            line = line.strip()
+            if line.startswith("["):
+                if tokens:
+                    yield " ".join(tokens), result
+                    tokens = []
+                    result = None
+                if line.startswith("[Result "):
+                    result = _tag_value(line)
+                continue
             if not line:
-                break
-    move_line = " ".join(move_lines)
+                if tokens:
+                    yield " ".join(tokens), result
+                    tokens = []
+                    result = None
+                continue
+        line, in_comment = _strip_comments(line, in_comment)
+        for token in line.split():
+            tokens.append(token)
+            if token in RESULTS:
+                yield " ".join(tokens), result
+                tokens = []
+                result = None
+    if tokens:
+        yield " ".join(tokens), result
+
+
+def _tag_value(line: str) -> str | None:
+    # The quoted value of a tag line such as [Result "1-0"], None when the
+    # tag is malformed
+    _, quote, rest = line.partition('"')
+    value, quote, _ = rest.partition('"')
+    return value if quote else None
+
+
+def _strip_comments(text: str, in_comment: bool = False) -> tuple[str, bool]:
+    # Removes {...} comments, which may span lines. Returns the remaining
+    # text and whether a comment is still open at the end of it.
+    kept = []
+    while text:
+        if in_comment:
+            _, brace, text = text.partition("}")
+            in_comment = not brace
+        else:
+            before, brace, text = text.partition("{")
+            kept.append(before)
+            in_comment = bool(brace)
+    return " ".join(kept), in_comment
 
+
+def parse_pdn_game(
+    move_text: str, tag_result: str | None = None
+) -> tuple[list, str | None]:
+    # The result token in the move text wins over the Result tag
+    moves, result = parse_pdn_moves(move_text)
+    return moves, result if result is not None else tag_result
+
+
+def parse_pdn_moves(move_line: str) -> tuple[list, str | None]:
+    # Raises ValueError for a token that looks like a move but isn't one.
+    # Move numbers may be attached to the move ("1.22-18"), moves may
+    # carry annotations ("22-18!") and {...} comments are ignored.
     moves = []
-    tokens = move_line.split(" ")
+    result = None
+    tokens = _strip_comments(move_line)[0].split()
     for token in tokens:
-        if token in ("1-0", "0-1", "1/2-1/2"):
+        if token in RESULTS:
+            result = token
             continue
-        elif "-" in token:
+        token = token.rpartition(".")[2].rstrip("!?")
+        if "-" in token:
             moves_new = [int(x) for x in token.split("-")]
             moves.append(tuple(moves_new))
         elif "x" in token:
             moves_new = [int(x) for x in token.split("x")]
             moves.append(tuple(moves_new))
 
-    return moves
+    return moves, result
+
+
+def move_to_pdn(
+    start: tuple[int, int],
+    path: list[tuple[int, int]],
+    variant: Variant = ENGLISH,
+    *,
+    capture: bool,
+) -> str:
+    # Whether the move is a capture can't be told from its squares alone
+    # (flying kings move and capture over any distance), use
+    # game_move_to_pdn to work it out from the position
+    separator = "x" if capture else "-"
+    numbers = variant.geometry.square_numbers
+    return separator.join(str(numbers[sq]) for sq in [start, *path])
+
+
+def game_move_to_pdn(
+    game: CheckersGame, start: tuple[int, int], path: list[tuple[int, int]]
+) -> str:
+    # Makes and takes back the move to find out whether it is a capture
+    undo = game.make_move(start, path)
+    game.unmake_move(undo)
+    return move_to_pdn(start, path, game.variant, capture=bool(undo[3]))
+
+
+def move_from_pdn(move: tuple[int, ...], variant: Variant = ENGLISH) -> Move:
+    squares = variant.geometry.squares
+    for n in move:
+        if not 1 <= n <= len(squares):
+            raise ValueError(f"no square {n} on a {variant.name} board")
+    start = squares[move[0] - 1]
+    path = [squares[x - 1] for x in move[1:]]
+    return start, path
+
+
+def replay(moves: list, variant: Variant = ENGLISH) -> Iterator[CheckersGame]:
+    # Yields the game after each move, starting with the initial position.
+    # The same game object is yielded every time.
+    game = initial_setup_board(variant)
+    yield game
+    for move in moves:
+        game.move(*move_from_pdn(move, variant))
+        yield game
 
 
 if __name__ == "__main__":
@@ -34,12 +171,5 @@ if __name__ == "__main__":
     moves = read_checkers_pdn(filename)
     print(moves)
 
-    game = initial_setup_board()
-    print(f"{game}\n")
-    for move in moves:
-        start = move[0]
-        path = move[1:]
-        start = square_number_to_pos(start)
-        path = [square_number_to_pos(x) for x in path]
-        game.move(start, path)
+    for game in replay(moves):
         print(f"{game}\n")
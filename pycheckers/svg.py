@@ -5,10 +5,11 @@ import xml.etree.ElementTree as ET
 
 
 def render(game: CheckersGame, board_size: int) -> str:
-    square_size = board_size // 8
+    size = game.variant.size
+    square_size = board_size // size
     svg = ET.Element("svg", board_attributes(board_size))
-    for y in range(8):
-        for x in range(8):
+    for y in range(size):
+        for x in range(size):
             piece = game.board.get((x, y))
 
             # draw empty square
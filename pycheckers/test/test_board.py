@@ -1,6 +1,7 @@
 import pytest
 from pycheckers.game import *
 from pycheckers.square import pos_to_square_number, square_number_to_pos
+from pycheckers.zobrist import position_hash
 
 
 def test_squares_to_consider_for_man():
@@ -260,5 +261,151 @@ def test_square_number_to_pos():
     assert square_number_to_pos(32) == (6, 7)
 
 
+def test_make_unmake_restores_position():
+    game = CheckersGame.with_board(
+        {
+            (2, 7): CheckerPiece(CheckerColor.RED, CheckerLevel.MAN),
+            (3, 6): CheckerPiece(CheckerColor.WHITE, CheckerLevel.MAN),
+            (3, 4): CheckerPiece(CheckerColor.WHITE, CheckerLevel.MAN),
+        },
+        turn=CheckerColor.RED,
+    )
+    board = game.board.copy()
+    start_hash = game.hash
+
+    undo = game.make_move((2, 7), [(4, 5), (2, 3)])
+    assert game.board == {(2, 3): CheckerPiece(CheckerColor.RED, CheckerLevel.MAN)}
+    assert game.hash == position_hash(game.board, game.turn)
+    assert game.turn == CheckerColor.WHITE
+
+    game.unmake_move(undo)
+    assert game.board == board
+    assert game.hash == start_hash
+    assert game.turn == CheckerColor.RED
+    assert game.history == [start_hash]
+
+
+def test_promotion_hash():
+    game = CheckersGame.with_board(
+        {
+            (2, 1): CheckerPiece(CheckerColor.RED, CheckerLevel.MAN),
+            (7, 6): CheckerPiece(CheckerColor.WHITE, CheckerLevel.MAN),
+        }
+    )
+    game.move((2, 1), [(1, 0)])
+    assert game.board[1, 0] == CheckerPiece(CheckerColor.RED, CheckerLevel.KING)
+    assert game.hash == position_hash(game.board, game.turn)
+
+
+def _shuffling_kings(draw_rules: DrawRules = DEFAULT_DRAW_RULES) -> CheckersGame:
+    return CheckersGame.with_board(
+        {
+            (1, 0): CheckerPiece(CheckerColor.RED, CheckerLevel.KING),
+            (6, 7): CheckerPiece(CheckerColor.WHITE, CheckerLevel.KING),
+        },
+        draw_rules=draw_rules,
+    )
+
+
+def test_repetition_draw():
+    game = _shuffling_kings()
+    for _ in range(2):
+        assert not game.is_over()
+        game.move((1, 0), [(0, 1)])
+        game.move((6, 7), [(7, 6)])
+        game.move((0, 1), [(1, 0)])
+        game.move((7, 6), [(6, 7)])
+
+    assert game.repetition_count() == 3
+    assert game.is_draw()
+    assert game.is_over()
+    assert game.winner() is None
+
+
+def test_quiet_move_limit():
+    game = _shuffling_kings(DrawRules(repetitions=0, quiet_move_limit=4))
+    game.move((1, 0), [(0, 1)])
+    game.move((6, 7), [(7, 6)])
+    game.move((0, 1), [(1, 0)])
+    assert not game.is_draw()
+    game.move((7, 6), [(6, 7)])
+    assert game.is_draw()
+
+
+def test_man_move_resets_quiet_plies():
+    game = CheckersGame.with_board(
+        {
+            (1, 0): CheckerPiece(CheckerColor.RED, CheckerLevel.KING),
+            (6, 1): CheckerPiece(CheckerColor.WHITE, CheckerLevel.MAN),
+        }
+    )
+    game.move((1, 0), [(0, 1)])
+    assert game.quiet_plies == 1
+    game.move((6, 1), [(7, 2)])
+    assert game.quiet_plies == 0
+
+
+def test_iter_moves_only_captures_when_capture_available():
+    game = CheckersGame.with_board(
+        {
+            (0, 7): CheckerPiece(CheckerColor.RED, CheckerLevel.MAN),
+            (2, 7): CheckerPiece(CheckerColor.RED, CheckerLevel.MAN),
+            (3, 6): CheckerPiece(CheckerColor.WHITE, CheckerLevel.MAN),
+        },
+        turn=CheckerColor.RED,
+    )
+    assert list(iter_moves(game)) == [((2, 7), [(4, 5)])]
+
+
+def test_iter_moves_is_lazy(monkeypatch):
+    import pycheckers.game
+
+    # Both white men can capture, the first capture is yielded before
+    # the second man's captures are searched
+    game = CheckersGame.with_board(
+        {
+            (1, 2): CheckerPiece(CheckerColor.WHITE, CheckerLevel.MAN),
+            (5, 2): CheckerPiece(CheckerColor.WHITE, CheckerLevel.MAN),
+            (2, 3): CheckerPiece(CheckerColor.RED, CheckerLevel.MAN),
+            (6, 3): CheckerPiece(CheckerColor.RED, CheckerLevel.MAN),
+        },
+        turn=CheckerColor.WHITE,
+    )
+    searched = []
+    find_capture_paths = pycheckers.game._find_capture_paths
+
+    def counting_find_capture_paths(game, piece, start, *args):
+        if start not in searched:
+            searched.append(start)
+        return find_capture_paths(game, piece, start, *args)
+
+    monkeypatch.setattr(
+        pycheckers.game, "_find_capture_paths", counting_find_capture_paths
+    )
+    moves = iter_moves(game)
+    assert next(moves) == ((1, 2), [(3, 4)])
+    assert searched == [(1, 2)]
+    assert list(moves) == [((5, 2), [(7, 4)])]
+    assert searched == [(1, 2), (5, 2)]
+
+
+def test_iter_moves_killers_and_history():
+    game = CheckersGame.with_board(
+        {
+            (2, 7): CheckerPiece(CheckerColor.RED, CheckerLevel.MAN),
+            (4, 7): CheckerPiece(CheckerColor.RED, CheckerLevel.MAN),
+        },
+        turn=CheckerColor.RED,
+    )
+    killers = [((4, 7), [(5, 6)]), ((6, 7), [(7, 6)])]
+    history = {((2, 7), (1, 6)): 10}
+    assert list(iter_moves(game, killers, history)) == [
+        ((4, 7), [(5, 6)]),
+        ((2, 7), [(1, 6)]),
+        ((2, 7), [(3, 6)]),
+        ((4, 7), [(3, 6)]),
+    ]
+
+
 if __name__ == "__main__":
     pytest.main(["-vv"])
@@ -0,0 +1,131 @@
+import pytest
+import subprocess
+import sys
+from pycheckers.cli import main
+
+GAMES = """\
+1. 22-18 11-15 2. 18x11 8x15 0-1
+
+1. 22-18 11-15 2. 23-19 0-1
+"""
+
+
+def test_cli_does_not_import_search_or_rendering():
+    code = (
+        "import sys, pycheckers.cli; "
+        "print(any(m in sys.modules for m in "
+        "('pycheckers.minimax', 'pycheckers.svg', 'xml.etree', 'random')))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert result.stdout.strip() == "False"
+
+
+def test_replay(tmp_path, capsys):
+    path = tmp_path / "games.pdn"
+    path.write_text(GAMES)
+    assert main(["replay", str(path), str(path)]) == 1
+    lines = capsys.readouterr().out.splitlines()
+    assert lines[0] == f"{path}#1: ok, 4 plies, result 0-1"
+    assert lines[1].startswith(f"{path}#2: invalid game")
+    assert len(lines) == 4
+
+
+def test_analyse_and_render(tmp_path, capsys):
+    path = tmp_path / "games.pdn"
+    path.write_text(GAMES.split("\n\n")[0])
+    assert main(["analyse", "--depth", "2", str(path)]) == 0
+    assert capsys.readouterr().out.startswith(f"{path}#1: ")
+
+    assert main(["render", "--output-dir", str(tmp_path), str(path)]) == 0
+    assert (tmp_path / "games.pdn-1.svg").read_text().startswith("<svg")
+
+
+def test_play(capsys):
+    assert main(["play", "--depth", "1", "--max-plies", "6"]) == 0
+    moves, result = capsys.readouterr().out.splitlines()
+    assert len(moves.split()) == 6
+    assert result == "1/2-1/2"
+
+
+def test_batch_continues_after_bad_input(tmp_path, capsys):
+    bad = tmp_path / "bad.pdn"
+    bad.write_text("1. 22-18 11-1x5 0-1\n")
+    good = tmp_path / "games.pdn"
+    good.write_text(GAMES)
+    missing = tmp_path / "missing.pdn"
+    assert main(["replay", str(missing), str(bad), str(good)]) == 1
+    lines = capsys.readouterr().out.splitlines()
+    assert lines[0].startswith(f"{missing}: ")
+    assert lines[1].startswith(f"{bad}#1: invalid game")
+    assert lines[2] == f"{good}#1: ok, 4 plies, result 0-1"
+
+    # Games that can't be analysed or rendered fail the run the same way
+    assert main(["analyse", "--depth", "1", str(bad), str(good)]) == 1
+    captured = capsys.readouterr()
+    assert captured.err.startswith(f"{bad}#1: invalid game")
+    assert captured.out.startswith(f"{good}#1: ")
+    assert main(["render", "--output-dir", str(tmp_path), str(good)]) == 1
+
+
+def test_render_names_outputs_by_path(tmp_path):
+    for directory in ("a", "b"):
+        (tmp_path / directory).mkdir()
+        (tmp_path / directory / "g.pdn").write_text(GAMES.split("\n\n")[0])
+    output_dir = tmp_path / "svg"
+    output_dir.mkdir()
+    files = [str(tmp_path / "a" / "g.pdn"), str(tmp_path / "b" / "g.pdn")]
+    assert main(["render", "--output-dir", str(output_dir), *files]) == 0
+    assert len(list(output_dir.iterdir())) == 2
+
+
+def test_star_import_is_unchanged():
+    code = (
+        "from pycheckers import *; "
+        "print(CheckersGame.__name__, render.__name__, legal_moves.__name__)"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert result.stdout.split() == ["CheckersGame", "render", "legal_moves"]
+
+
+def test_analyse_games_independently(tmp_path, capsys):
+    # Each game gets its own transposition table, so a game's analysis
+    # doesn't depend on the games analysed before it
+    first = tmp_path / "first.pdn"
+    first.write_text("1. 22-18 11-15 2. 18x11 8x15 *\n")
+    second = tmp_path / "second.pdn"
+    second.write_text("1. 22-17 11-15 2. 17-13 15-18 *\n")
+    assert main(["analyse", "--depth", "4", str(second)]) == 0
+    alone = capsys.readouterr().out
+    assert main(["analyse", "--depth", "4", str(first), str(second)]) == 0
+    assert capsys.readouterr().out.endswith(alone)
+
+
+def test_malformed_archives(tmp_path, capsys):
+    bad_tag = tmp_path / "tag.pdn"
+    bad_tag.write_text("[Result 1-0]\n1. 22-18 11-15 *\n")
+    latin1 = tmp_path / "latin1.pdn"
+    latin1.write_bytes('[White "Côté"]\n1. 22-18 11-15 *\n'.encode("latin-1"))
+    assert main(["replay", str(bad_tag), str(latin1)]) == 0
+    lines = capsys.readouterr().out.splitlines()
+    assert lines == [
+        f"{bad_tag}#1: ok, 2 plies, result *",
+        f"{latin1}#1: ok, 2 plies, result *",
+    ]
+
+
+def test_play_invalid_opening(capsys):
+    assert main(["play", "--depth", "1", "--moves", "22-17 22-18"]) == 1
+    assert capsys.readouterr().err.startswith("invalid opening: ")
+    assert main(["play", "--depth", "1", "--moves", "22-99"]) == 1
+
+
+def test_analyse_rejects_zero_lines(tmp_path, capsys):
+    path = tmp_path / "games.pdn"
+    path.write_text(GAMES)
+    with pytest.raises(SystemExit):
+        main(["analyse", "--multipv", "0", str(path)])
+    assert "must be at least 1" in capsys.readouterr().err
@@ -0,0 +1,125 @@
+import pytest
+from pycheckers.database import PositionDatabase, game_entries
+from pycheckers.game import initial_setup_board
+from pycheckers.read_and_play import read_pdn_games, split_pdn_games
+
+ARCHIVE = """\
+[Event "first"]
+[Result "1-0"]
+
+1. 22-18 11-15 2. 18x11 8x15 1-0
+
+[Event "second"]
+[Result "0-1"]
+
+1. 22-18 11-16 2. 23-19 0-1
+
+[Event "third"]
+1. 22-17 9-13 1/2-1/2
+"""
+
+
+def _archive(tmp_path) -> str:
+    path = tmp_path / "archive.pdn"
+    path.write_text(ARCHIVE)
+    return str(path)
+
+
+def test_read_pdn_games(tmp_path):
+    games = list(read_pdn_games(_archive(tmp_path)))
+    assert games == [
+        ([(22, 18), (11, 15), (18, 11), (8, 15)], "1-0"),
+        ([(22, 18), (11, 16), (23, 19)], "0-1"),
+        ([(22, 17), (9, 13)], "1/2-1/2"),
+    ]
+
+
+def test_position_queries(tmp_path):
+    db = PositionDatabase()
+    assert db.add_games(game_entries([_archive(tmp_path)]), batch_size=2) == 3
+
+    game = initial_setup_board()
+    assert db.outcome_stats(game.hash) == {"1-0": 1, "0-1": 1, "1/2-1/2": 1}
+    assert db.outcome_stats_after_move(game, (2, 5), [(3, 4)]) == {"1-0": 1, "0-1": 1}
+    assert db.outcome_stats_after_move(game, (2, 5), [(1, 4)]) == {"1/2-1/2": 1}
+
+    game.move((2, 5), [(3, 4)])
+    assert db.games_with_position(game.hash) == [(1, 1, "1-0"), (2, 1, "0-1")]
+
+    # Further ingests continue the game numbering
+    db.add_games([("extra", "1-0", [game.hash])])
+    assert db.games_with_position(game.hash)[-1] == (4, 0, "1-0")
+
+
+def test_invalid_games_are_skipped(tmp_path, capsys):
+    path = tmp_path / "bad.pdn"
+    # An illegal move (a capture is mandatory), a malformed token, then
+    # annotated and compact move text that is valid
+    path.write_text(
+        "1. 22-18 11-15 2. 23-19 1-0\n\n"
+        "1. 22-18 11-1x5 0-1\n\n"
+        "1.22-18! 11-15?! 1/2-1/2\n"
+    )
+    db = PositionDatabase()
+    missing = str(tmp_path / "missing.pdn")
+    assert db.add_games(game_entries([str(path), missing, _archive(tmp_path)])) == 4
+    errors = capsys.readouterr().err.splitlines()
+    assert [e.split(": ")[0] for e in errors] == [f"{path}#1", f"{path}#2", missing]
+
+    game = initial_setup_board()
+    game.move((2, 5), [(3, 4)])
+    assert db.outcome_stats(game.hash) == {"1/2-1/2": 1, "1-0": 1, "0-1": 1}
+    plan = db.connection.execute(
+        "EXPLAIN QUERY PLAN SELECT game_id FROM positions WHERE hash = 1"
+    ).fetchall()
+    assert "positions_hash" in str(plan)
+
+
+def test_index_rebuilt_after_failed_ingest():
+    def entries():
+        yield "good", "1-0", [1, 2]
+        raise RuntimeError("archive went away")
+
+    db = PositionDatabase()
+    with pytest.raises(RuntimeError):
+        db.add_games(entries(), batch_size=1)
+    assert db.games_with_position(2) == [(1, 1, "1-0")]
+    plan = db.connection.execute(
+        "EXPLAIN QUERY PLAN SELECT game_id FROM positions WHERE hash = 1"
+    ).fetchall()
+    assert "positions_hash" in str(plan)
+
+
+def test_split_pdn_games():
+    lines = [
+        '[Result 1-0]\n',
+        '1. 22-18 {a good-move, not 22-17} 11-15 1-0\n',
+        "1. 22-17 {spans\n",
+        "lines 9-13} 9-13 0-1\n",
+    ]
+    assert list(split_pdn_games(lines)) == [
+        ("1. 22-18 11-15 1-0", None),
+        ("1. 22-17 9-13 0-1", None),
+    ]
+
+
+def test_non_utf8_archive(tmp_path):
+    path = tmp_path / "latin1.pdn"
+    path.write_bytes('[White "Côté"]\n1. 22-18 11-15 *\n'.encode("latin-1"))
+    assert list(read_pdn_games(str(path))) == [([(22, 18), (11, 15)], "*")]
+
+
+def test_append_keeps_index():
+    db = PositionDatabase()
+    db.add_games([("first", "1-0", [1, 2])])
+
+    def entries():
+        # The index is still there while a game is appended
+        (count,) = db.connection.execute(
+            "SELECT COUNT(*) FROM sqlite_master WHERE name = 'positions_hash'"
+        ).fetchone()
+        assert count == 1
+        yield "second", "0-1", [1, 3]
+
+    assert db.add_games(entries()) == 1
+    assert db.games_with_position(1) == [(1, 0, "1-0"), (2, 0, "0-1")]
@@ -0,0 +1,54 @@
+import pytest
+from pycheckers.match import (
+    EngineConfig,
+    GameRecord,
+    EngineTally,
+    MatchResult,
+    ballot_openings,
+    play_game,
+    run_match,
+    score_to_elo,
+)
+from pycheckers.piece import CheckerColor
+
+
+def test_ballot_openings():
+    assert len(ballot_openings(1)) == 7
+    assert len(ballot_openings(2)) == 49
+
+
+def test_play_game_terminates():
+    engine = EngineConfig("depth 1", 1)
+    opening = ballot_openings(1)[0]
+    record = play_game(engine, engine, opening, CheckerColor.RED, max_plies=30)
+    assert record.plies <= 30
+    assert record.engine_a.moves + record.engine_b.moves == record.plies - 1
+    assert record.engine_a.nodes > 0
+
+
+def test_run_match_swaps_colors():
+    engine_a = EngineConfig("A", 1)
+    engine_b = EngineConfig("B", 1)
+    openings = ballot_openings(1)[:2]
+    result = run_match(engine_a, engine_b, openings, workers=1, max_plies=20)
+    assert len(result.games) == 4
+    assert [g.engine_a_color for g in result.games] == [
+        CheckerColor.RED,
+        CheckerColor.WHITE,
+    ] * 2
+    assert result.wins + result.draws + result.losses == 4
+
+
+def test_match_statistics():
+    engine = EngineConfig("A", 1)
+    result = MatchResult(engine, engine)
+    for winner in (CheckerColor.RED, CheckerColor.RED, CheckerColor.WHITE, None):
+        result.games.append(
+            GameRecord((), CheckerColor.RED, winner, 0, EngineTally(), EngineTally())
+        )
+    assert (result.wins, result.draws, result.losses) == (2, 1, 1)
+    assert result.score == pytest.approx(0.625)
+    low, high = result.confidence_interval()
+    assert low < result.score < high
+    assert score_to_elo(0.5) == 0
+    assert score_to_elo(1.0) == float("inf")
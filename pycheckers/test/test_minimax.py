@@ -0,0 +1,141 @@
+import pytest
+from pycheckers.game import CheckersGame, initial_setup_board
+from pycheckers.minimax import SearchStats, analyse, minimax
+from pycheckers.piece import CheckerColor, CheckerLevel, CheckerPiece
+
+
+def _hanging_man_game() -> CheckersGame:
+    # White moving (3, 2) to (4, 3) lets red capture it
+    return CheckersGame.with_board(
+        {
+            (3, 2): CheckerPiece(CheckerColor.WHITE, CheckerLevel.MAN),
+            (7, 0): CheckerPiece(CheckerColor.WHITE, CheckerLevel.MAN),
+            (5, 4): CheckerPiece(CheckerColor.RED, CheckerLevel.MAN),
+        },
+        turn=CheckerColor.WHITE,
+    )
+
+
+def test_without_quiescence_misses_capture():
+    game = _hanging_man_game()
+    value, pos, path = minimax(game, 1, True, verbose=False, quiescence_nodes=0)
+    assert value == 1
+    assert (pos, path) == ((3, 2), [(4, 3)])
+
+
+def test_quiescence_sees_capture():
+    game = _hanging_man_game()
+    stats = SearchStats()
+    value, pos, path = minimax(game, 1, True, stats=stats, verbose=False)
+    assert value == 1
+    assert (pos, path) != ((3, 2), [(4, 3)])
+    assert stats.quiescence_nodes == 1
+    assert stats.quiescence_depth == 1
+
+
+def _exchange_game() -> CheckersGame:
+    # White moving (3, 2) to (4, 3) lets red capture it, then white
+    # recaptures from (2, 1) and wins
+    return CheckersGame.with_board(
+        {
+            (3, 2): CheckerPiece(CheckerColor.WHITE, CheckerLevel.MAN),
+            (2, 1): CheckerPiece(CheckerColor.WHITE, CheckerLevel.MAN),
+            (1, 0): CheckerPiece(CheckerColor.WHITE, CheckerLevel.MAN),
+            (5, 4): CheckerPiece(CheckerColor.RED, CheckerLevel.MAN),
+        },
+        turn=CheckerColor.WHITE,
+    )
+
+
+def test_quiescence_finds_exchange():
+    game = _exchange_game()
+    stats = SearchStats()
+    value, pos, path = minimax(game, 1, True, stats=stats, verbose=False)
+    assert value == 100
+    assert (pos, path) == ((3, 2), [(4, 3)])
+    assert stats.quiescence_nodes == 2
+    assert stats.quiescence_limit_hits == 0
+
+
+def test_quiescence_node_limit():
+    game = _exchange_game()
+    stats = SearchStats()
+    value, pos, path = minimax(
+        game, 1, True, stats=stats, verbose=False, quiescence_nodes=1
+    )
+    # The recapture is past the budget, so the exchange is scored
+    # statically as a man down and a quiet move is preferred
+    assert stats.quiescence_nodes == 1
+    assert stats.quiescence_limit_hits > 0
+    assert value == 2
+    assert (pos, path) != ((3, 2), [(4, 3)])
+
+
+def test_search_restores_game():
+    game = _hanging_man_game()
+    board = game.board.copy()
+    start_hash = game.hash
+    minimax(game, 3, True, verbose=False)
+    assert game.board == board
+    assert game.hash == start_hash
+    assert game.turn == CheckerColor.WHITE
+
+
+def test_alpha_beta_matches_minimax():
+    game = initial_setup_board()
+    full_stats = SearchStats()
+    pruned_stats = SearchStats()
+    full = minimax(game, 4, False, stats=full_stats, verbose=False, alpha_beta=False)
+    pruned = minimax(game, 4, False, stats=pruned_stats, verbose=False)
+    assert full[0] == pruned[0]
+    assert pruned_stats.cutoffs > 0
+    assert pruned_stats.nodes < full_stats.nodes
+
+
+def test_table_matches_search_without_table():
+    game = initial_setup_board()
+    table = {}
+    stats = SearchStats()
+    plain = minimax(game, 5, False, verbose=False)
+    cached = minimax(game, 5, False, stats=stats, verbose=False, table=table)
+    assert cached[0] == plain[0]
+    assert table
+
+    # A second search of the same position is answered from the table
+    again = SearchStats()
+    value, _, _ = minimax(game, 5, False, stats=again, verbose=False, table=table)
+    assert value == plain[0]
+    assert again.table_hits > 0
+    assert again.nodes < stats.nodes
+
+
+def test_analyse_single_line_matches_minimax():
+    game = initial_setup_board()
+    value, _, _ = minimax(game, 4, False, verbose=False)
+    (line,) = analyse(game, 4)
+    assert line.score == value
+    assert line.depth == 4
+    assert len(line.pv) == len(line.moves) == 4
+    assert line.nodes > 0
+
+
+def test_analyse_multipv():
+    game = _hanging_man_game()
+    board = game.board.copy()
+    stats = SearchStats()
+    lines = analyse(game, 3, multipv=5, stats=stats)
+    # Nodes are counted per line
+    assert all(line.nodes > 0 for line in lines)
+    assert sum(line.nodes for line in lines) <= stats.nodes + stats.quiescence_nodes
+    # Only three legal moves, all returned best first
+    assert [line.score for line in lines] == [1, 1, 0]
+    assert lines[2].pv == ["10-15", "19x10", "4-8"]
+    assert len({line.pv[0] for line in lines}) == 3
+    assert all(len(line.pv) == 3 for line in lines)
+    assert [line.score for line in analyse(game, 3, multipv=2)] == [1, 1]
+    assert game.board == board
+
+
+def test_analyse_needs_a_line():
+    with pytest.raises(ValueError):
+        analyse(initial_setup_board(), 2, multipv=0)
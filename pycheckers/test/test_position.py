@@ -0,0 +1,30 @@
+import pickle
+from pycheckers.game import initial_setup_board, random_move
+from pycheckers.piece import RED_MAN, CheckerColor, CheckerLevel, CheckerPiece
+from pycheckers.position import PackedPosition
+
+
+def test_pieces_are_interned():
+    assert CheckerPiece(CheckerColor.RED, CheckerLevel.MAN) is RED_MAN
+    assert pickle.loads(pickle.dumps(RED_MAN)) is RED_MAN
+
+
+def test_packed_position_round_trip():
+    game = initial_setup_board()
+    for _ in range(10):
+        random_move(game)
+
+    packed = PackedPosition.from_game(game)
+    assert len(packed) == 33
+    assert packed.turn == game.turn
+    assert packed.board() == game.board
+
+    restored = packed.to_game()
+    assert restored.board == game.board
+    assert restored.hash == game.hash
+
+
+def test_packed_position_hashable():
+    game = initial_setup_board()
+    positions = {PackedPosition.from_game(game), PackedPosition.from_game(game)}
+    assert len(positions) == 1
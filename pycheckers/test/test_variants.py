@@ -0,0 +1,92 @@
+from pycheckers.game import CheckersGame, initial_setup_board, legal_moves
+from pycheckers.piece import RED_KING, RED_MAN, WHITE_KING, WHITE_MAN, CheckerColor
+from pycheckers.variants import ENGLISH, INTERNATIONAL
+
+
+def _international(board: dict, turn: CheckerColor = CheckerColor.RED):
+    return CheckersGame.with_board(board, turn, variant=INTERNATIONAL)
+
+
+def test_english_geometry():
+    geometry = ENGLISH.geometry
+    assert len(geometry.squares) == 32
+    for n in range(1, 33):
+        assert geometry.pos_to_square_number(geometry.square_number_to_pos(n)) == n
+
+
+def test_international_geometry():
+    geometry = INTERNATIONAL.geometry
+    assert len(geometry.squares) == 50
+    assert geometry.square_number_to_pos(1) == (1, 0)
+    assert geometry.square_number_to_pos(6) == (0, 1)
+    assert geometry.square_number_to_pos(50) == (8, 9)
+
+
+def test_international_initial_position():
+    game = initial_setup_board(INTERNATIONAL)
+    assert len(game.board) == 40
+    assert sum(len(paths) for paths in legal_moves(game).values()) == 9
+
+
+def test_men_capture_backwards():
+    game = _international({(4, 5): RED_MAN, (5, 6): WHITE_MAN})
+    assert legal_moves(game) == {(4, 5): [[(6, 7)]]}
+
+
+def test_flying_king_moves():
+    game = _international({(0, 9): RED_KING, (9, 0): WHITE_MAN})
+    assert legal_moves(game) == {
+        (0, 9): [[(x, 9 - x)] for x in range(1, 9)],
+    }
+
+
+def test_flying_king_captures_at_distance():
+    game = _international({(0, 9): RED_KING, (4, 5): WHITE_MAN})
+    assert legal_moves(game) == {
+        (0, 9): [[(x, 9 - x)] for x in range(5, 10)],
+    }
+
+    game.move((0, 9), [(7, 2)])
+    assert game.board == {(7, 2): RED_KING}
+
+
+def test_maximum_capture_rule():
+    game = _international(
+        {
+            (2, 7): RED_MAN,
+            (3, 6): WHITE_MAN,
+            (3, 4): WHITE_MAN,
+            (6, 7): RED_MAN,
+            (7, 6): WHITE_MAN,
+        }
+    )
+    assert legal_moves(game) == {(2, 7): [[(4, 5), (2, 3)]]}
+
+
+def test_pieces_cannot_be_jumped_twice():
+    # The king could otherwise jump back over (2, 7) to its start square
+    game = _international({(0, 9): RED_KING, (2, 7): WHITE_MAN})
+    assert legal_moves(game) == {
+        (0, 9): [[(x, 9 - x)] for x in range(3, 10)],
+    }
+
+
+def test_promotion_only_at_end_of_move():
+    game = _international({(2, 1): RED_MAN, (1, 0): WHITE_KING})
+    game.move((2, 1), [(3, 0)])
+    assert game.board[3, 0] == RED_KING
+
+    game = _international(
+        {(3, 2): RED_MAN, (4, 1): WHITE_MAN, (6, 1): WHITE_MAN, (9, 9): WHITE_MAN}
+    )
+    game.move((3, 2), [(5, 0), (7, 2)])
+    assert game.board[7, 2] == RED_MAN
+
+
+def test_international_search():
+    from pycheckers.minimax import minimax
+
+    game = initial_setup_board(INTERNATIONAL)
+    value, pos, path = minimax(game, 2, False, verbose=False)
+    game.move(pos, path)
+    assert game.turn == CheckerColor.WHITE
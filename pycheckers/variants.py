@@ -0,0 +1,168 @@
+from pycheckers.piece import (
+    RED_KING,
+    RED_MAN,
+    WHITE_KING,
+    WHITE_MAN,
+    CheckerColor,
+)
+
+# Diagonal directions, in the order moves are generated
+KING_DIRECTIONS = ((1, 1), (-1, 1), (-1, -1), (1, -1))
+MAN_DIRECTIONS = {
+    CheckerColor.WHITE: ((1, 1), (-1, 1)),
+    CheckerColor.RED: ((1, -1), (-1, -1)),
+}
+
+
+class Geometry:
+    # Board geometry for a square board of the given size, with every
+    # table a move generator needs computed once up front. Playable
+    # squares are those with x + y odd, numbered from 1 row by row
+    # starting at the top left, as in PDN.
+    __slots__ = ("size", "squares", "square_numbers", "rays", "between")
+
+    def __init__(self, size: int):
+        self.size = size
+        self.squares = [
+            (x, y) for y in range(size) for x in range(size) if (x + y) % 2 == 1
+        ]
+        self.square_numbers = {pos: n for n, pos in enumerate(self.squares, 1)}
+
+        # rays[pos][direction]: the squares from pos to the edge of the
+        # board, nearest first
+        self.rays = {}
+        # between[start, end]: the squares strictly between two squares on
+        # the same diagonal
+        self.between = {}
+        for pos in self.squares:
+            self.rays[pos] = {}
+            for dx, dy in KING_DIRECTIONS:
+                ray = []
+                x, y = pos[0] + dx, pos[1] + dy
+                while self.in_bounds((x, y)):
+                    ray.append((x, y))
+                    x, y = x + dx, y + dy
+                self.rays[pos][dx, dy] = tuple(ray)
+                for i, end in enumerate(ray):
+                    self.between[pos, end] = tuple(ray[:i])
+
+    def in_bounds(self, pos: tuple[int, int]) -> bool:
+        x, y = pos
+        return 0 <= x < self.size and 0 <= y < self.size
+
+    def pos_to_square_number(self, pos: tuple[int, int]) -> int:
+        return self.square_numbers[pos]
+
+    def square_number_to_pos(self, n: int) -> tuple[int, int]:
+        return self.squares[n - 1]
+
+
+class Variant:
+    # The rules of a draughts variant, with per-piece move tables
+    # precomputed from its geometry:
+    # steps[piece][pos]: squares a piece can move to when they are empty
+    # jumps[piece][pos]: (jumped square, landing square) pairs for captures
+    # rays[pos]: diagonals from pos, for flying kings
+    __slots__ = (
+        "name",
+        "geometry",
+        "size",
+        "start_rows",
+        "men_capture_backwards",
+        "flying_kings",
+        "maximum_capture",
+        "promotion_row",
+        "steps",
+        "jumps",
+        "rays",
+        "between",
+    )
+
+    def __init__(
+        self,
+        name: str,
+        size: int,
+        start_rows: int,
+        men_capture_backwards: bool = False,
+        flying_kings: bool = False,
+        maximum_capture: bool = False,
+    ):
+        self.name = name
+        self.size = size
+        self.start_rows = start_rows
+        self.men_capture_backwards = men_capture_backwards
+        self.flying_kings = flying_kings
+        self.maximum_capture = maximum_capture
+        self.promotion_row = {CheckerColor.RED: 0, CheckerColor.WHITE: size - 1}
+
+    def __getattr__(self, name: str):
+        # The tables are built on first use, so that variants which are
+        # never played cost nothing at import time. Once built they are
+        # ordinary slot attributes and this is not called again.
+        if name in _TABLES:
+            self._build_tables()
+            return object.__getattribute__(self, name)
+        raise AttributeError(f"'Variant' object has no attribute '{name}'")
+
+    def _build_tables(self) -> None:
+        self.geometry = geometry = Geometry(self.size)
+        self.rays = geometry.rays
+        self.between = geometry.between
+
+        self.steps = {}
+        self.jumps = {}
+        for piece in (RED_MAN, RED_KING, WHITE_MAN, WHITE_KING):
+            if piece in (RED_KING, WHITE_KING):
+                step_directions = jump_directions = KING_DIRECTIONS
+            else:
+                step_directions = MAN_DIRECTIONS[piece.color]
+                jump_directions = (
+                    KING_DIRECTIONS if self.men_capture_backwards else step_directions
+                )
+            self.steps[piece] = {}
+            self.jumps[piece] = {}
+            for pos in geometry.squares:
+                rays = geometry.rays[pos]
+                self.steps[piece][pos] = tuple(
+                    rays[d][0] for d in step_directions if rays[d]
+                )
+                self.jumps[piece][pos] = tuple(
+                    (rays[d][0], rays[d][1])
+                    for d in jump_directions
+                    if len(rays[d]) > 1
+                )
+
+    def start_squares(self, color: CheckerColor) -> list[tuple[int, int]]:
+        if color == CheckerColor.WHITE:
+            rows = range(self.start_rows)
+        else:
+            rows = range(self.size - self.start_rows, self.size)
+        # Worked out from the size rather than the geometry, so that the
+        # tables aren't built just to list the start squares
+        return [(x, y) for y in rows for x in range(self.size) if (x + y) % 2 == 1]
+
+    def __repr__(self):
+        return f"Variant({self.name!r})"
+
+    def __reduce__(self):
+        # Variants are shared instances, look them up by name when unpickling
+        return variant_by_name, (self.name,)
+
+
+_TABLES = ("geometry", "steps", "jumps", "rays", "between")
+
+ENGLISH = Variant("english", 8, 3)
+INTERNATIONAL = Variant(
+    "international",
+    10,
+    4,
+    men_capture_backwards=True,
+    flying_kings=True,
+    maximum_capture=True,
+)
+
+VARIANTS = {variant.name: variant for variant in (ENGLISH, INTERNATIONAL)}
+
+
+def variant_by_name(name: str) -> Variant:
+    return VARIANTS[name]
@@ -0,0 +1,50 @@
+from pycheckers.piece import CheckerColor, CheckerLevel, CheckerPiece
+
+# Keys are kept to 63 bits so that hashes fit in a signed 64-bit integer
+_MASK = (1 << 63) - 1
+
+MAX_BOARD_SIZE = 10
+
+
+def _splitmix64(state: int) -> tuple[int, int]:
+    state = (state + 0x9E3779B97F4A7C15) & 0xFFFFFFFFFFFFFFFF
+    z = state
+    z = ((z ^ (z >> 30)) * 0xBF58476D1CE4E5B9) & 0xFFFFFFFFFFFFFFFF
+    z = ((z ^ (z >> 27)) * 0x94D049BB133111EB) & 0xFFFFFFFFFFFFFFFF
+    return state, (z ^ (z >> 31)) & _MASK
+
+
+def _make_keys(seed: int) -> tuple[dict, int]:
+    state = seed
+    keys = {}
+    pieces = [
+        CheckerPiece(color, level) for color in CheckerColor for level in CheckerLevel
+    ]
+    for piece in pieces:
+        for y in range(8):
+            for x in range(8):
+                state, keys[(x, y), piece] = _splitmix64(state)
+    state, turn_key = _splitmix64(state)
+    # Keys for larger boards are generated after the 8x8 ones, so that
+    # 8x8 hashes stay the same as the board size grows
+    for piece in pieces:
+        for y in range(MAX_BOARD_SIZE):
+            for x in range(MAX_BOARD_SIZE):
+                if ((x, y), piece) not in keys:
+                    state, keys[(x, y), piece] = _splitmix64(state)
+    return keys, turn_key
+
+
+# Fixed seed: hashes must be stable across processes and runs
+PIECE_KEYS, WHITE_TURN_KEY = _make_keys(0x5EED)
+
+
+def piece_key(pos: tuple[int, int], piece: CheckerPiece) -> int:
+    return PIECE_KEYS[pos, piece]
+
+
+def position_hash(board: dict, turn: CheckerColor) -> int:
+    h = WHITE_TURN_KEY if turn == CheckerColor.WHITE else 0
+    for pos, piece in board.items():
+        h ^= PIECE_KEYS[pos, piece]
+    return h
@@ -1,6 +1,6 @@
 #!/usr/bin/env python
 
-from distutils.core import setup
+from setuptools import setup
 
 setup(
     name="pycheckers",
@@ -10,4 +10,5 @@ setup(
     author_email="darius.scerb@gmail.com",
     url="https://",
     packages=["pycheckers"],
+    entry_points={"console_scripts": ["pycheckers = pycheckers.cli:main"]},
 )